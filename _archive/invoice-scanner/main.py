@@ -22,6 +22,10 @@ ALLOWED_TYPES = {
     "image/png": "image/png",
 }
 
+# Gemini rejects requests whose inline data exceeds 20 MB, so refuse
+# larger files before reading them.
+MAX_FILE_BYTES = 20 * 1024 * 1024
+
 
 def main():
     # Read input from stdin
@@ -41,13 +45,16 @@ def main():
     file_path = Path(file_info["path"])
     content_type = file_info.get("content_type", "application/octet-stream")
 
-    # Validate file exists
-    if not file_path.exists():
+    # Validate file exists (one stat also gives the size for the checks below)
+    try:
+        file_size = file_path.stat().st_size
+    except OSError:
         print(json.dumps({"error": f"File not found: {file_path}"}))
         sys.exit(1)
 
-    # Validate content type
-    if content_type not in ALLOWED_TYPES:
+    # Validate content type (exact match first; lowercase only on a miss)
+    mime_type = ALLOWED_TYPES.get(content_type) or ALLOWED_TYPES.get(content_type.lower())
+    if mime_type is None:
         print(json.dumps({
             "error": f"Invalid file type. Allowed: PDF, JPEG, PNG. Got: {content_type}"
         }))
@@ -59,15 +66,21 @@ def main():
         print(json.dumps({"error": "GEMINI_API_KEY environment variable is required"}))
         sys.exit(1)
 
+    # Validate size before reading the file into memory
+    if file_size == 0:
+        print(json.dumps({"error": "Empty file"}))
+        sys.exit(1)
+    if file_size > MAX_FILE_BYTES:
+        print(json.dumps({
+            "error": f"File too large: {file_size} bytes (max {MAX_FILE_BYTES} bytes)"
+        }))
+        sys.exit(1)
+
     # Read file and scan
     try:
         file_bytes = file_path.read_bytes()
-        if len(file_bytes) == 0:
-            print(json.dumps({"error": "Empty file"}))
-            sys.exit(1)
-
         scanner = GeminiInvoiceScanner(api_key)
-        result = scanner.scan_invoice(file_bytes, ALLOWED_TYPES[content_type])
+        result = scanner.scan_invoice(file_bytes, mime_type)
         print(json.dumps(result))
 
     except Exception as e:
@@ -7,8 +7,13 @@ Reads scan parameters from stdin JSON, performs security scanning, outputs JSON
 import asyncio
 import json
 import logging
+import multiprocessing
+import os
 import sys
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -33,6 +38,7 @@ from react_security_scanner.scanners import (
     scan_api_route_patterns,
     scan_config_patterns,
 )
+from react_security_scanner.scanners.common import walk_source_files
 from react_security_scanner.recommendations import generate_recommendations
 
 logging.basicConfig(level=logging.INFO)
@@ -41,6 +47,18 @@ logger = logging.getLogger(__name__)
 VALID_SCAN_MODES = {"full", "deps-only", "patterns-only"}
 VALID_FRAMEWORKS = {"auto", "nextjs", "react", "remix"}
 
+PATTERN_SCANNERS = (
+    scan_rsc_patterns,
+    scan_env_patterns,
+    scan_xss_patterns,
+    scan_api_route_patterns,
+    scan_config_patterns,
+)
+
+# Source files below which the scanners run in-process, as starting worker
+# processes would cost more than it saves
+PARALLEL_MIN_FILES = 100
+
 
 async def _call_dep_scanner(
     client: AgentClient,
@@ -88,16 +106,43 @@ def _parse_dep_scanner_results(result: dict[str, Any] | None) -> list[Dependency
     return findings
 
 
-def _run_pattern_scanners(scan_path: Path) -> list[Finding]:
-    """Run all local pattern scanners on the given path."""
-    all_findings: list[Finding] = []
+def _pool_context():
+    """Return the multiprocessing context for scanner worker processes.
 
-    all_findings.extend(scan_rsc_patterns(scan_path))
-    all_findings.extend(scan_env_patterns(scan_path))
-    all_findings.extend(scan_xss_patterns(scan_path))
-    all_findings.extend(scan_api_route_patterns(scan_path))
-    all_findings.extend(scan_config_patterns(scan_path))
+    Workers are never forked directly from this process: the pool starts
+    inside the running event loop, and a fork would copy its state along
+    with any locks held by the client's threads. The forkserver instead
+    forks them from a clean server process with the scanners imported.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["react_security_scanner.scanners"])
+        return context
+    return multiprocessing.get_context("spawn")
 
+
+def _run_pattern_scanners(scan_path: Path) -> list[Finding]:
+    """Run all local pattern scanners on the given path.
+
+    On larger projects each scanner runs in its own worker process. Findings
+    keep the scanners' order either way. Falls back to running them in turn
+    if a process pool cannot be started (e.g. sandboxes without /dev/shm).
+    """
+    file_count = sum(1 for _ in islice(walk_source_files(scan_path), PARALLEL_MIN_FILES))
+    workers = min(os.cpu_count() or 1, len(PATTERN_SCANNERS))
+    if file_count >= PARALLEL_MIN_FILES and workers > 1:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=_pool_context()
+            ) as executor:
+                futures = [executor.submit(scanner, scan_path) for scanner in PATTERN_SCANNERS]
+                return [finding for future in futures for finding in future.result()]
+        except (BrokenProcessPool, OSError, NotImplementedError):
+            pass
+
+    all_findings: list[Finding] = []
+    for scanner in PATTERN_SCANNERS:
+        all_findings.extend(scanner(scan_path))
     return all_findings
 
 
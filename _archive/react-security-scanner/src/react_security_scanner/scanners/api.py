@@ -38,6 +38,9 @@ API_AUTH_PATTERNS = [
     re.compile(r'withAuth', re.IGNORECASE),
 ]
 
+# Mutation methods, which need CORS configuration
+MUTATION_METHOD_PATTERN = re.compile(r'(?:POST|PUT|PATCH|DELETE)')
+
 # CORS patterns
 CORS_PATTERNS = [
     re.compile(r'Access-Control-Allow-Origin', re.IGNORECASE),
@@ -67,6 +70,9 @@ SQL_INJECTION_PATTERNS = [
     re.compile(r"""\.query\s*\(\s*["'][^"']*["']\s*\+"""),
 ]
 
+# Request body reads, which need input validation
+BODY_USAGE_PATTERN = re.compile(r'(?:req\.body|request\.json\(\)|await\s+req\.json\(\))')
+
 # Input validation patterns
 INPUT_VALIDATION_PATTERNS = [
     re.compile(r'\.parse\s*\('),
@@ -150,7 +156,7 @@ def scan_api_route_patterns(
             ))
 
         # 2. Missing CORS (only for mutation routes)
-        has_mutation = bool(re.search(r'(?:POST|PUT|PATCH|DELETE)', content))
+        has_mutation = bool(MUTATION_METHOD_PATTERN.search(content))
         has_cors = any(p.search(content) for p in CORS_PATTERNS)
         if has_mutation and not has_cors:
             findings.append(Finding(
@@ -212,9 +218,7 @@ def scan_api_route_patterns(
                     break
 
         # 5. Missing input validation
-        has_body_usage = bool(re.search(
-            r'(?:req\.body|request\.json\(\)|await\s+req\.json\(\))', content
-        ))
+        has_body_usage = bool(BODY_USAGE_PATTERN.search(content))
         has_validation = any(p.search(content) for p in INPUT_VALIDATION_PATTERNS)
         if has_body_usage and not has_validation:
             findings.append(Finding(
@@ -24,6 +24,13 @@ REQUIRED_SECURITY_HEADERS = [
     ("Permissions-Policy", "Permissions-Policy"),
 ]
 
+# Settings that weaken defaults
+STRICT_MODE_DISABLED = re.compile(r'reactStrictMode\s*:\s*false')
+POWERED_BY_ENABLED = re.compile(r'poweredByHeader\s*:\s*true')
+
+# headers() function, where security headers are configured
+HEADERS_FUNCTION = re.compile(r'async\s+headers\s*\(\s*\)')
+
 # Dangerous rewrite/redirect patterns
 INTERNAL_PROXY_PATTERN = re.compile(
     r"""(?:destination|url)\s*:\s*['"`](?:http://localhost|http://127\.0\.0\.1|http://internal)""",
@@ -86,7 +93,7 @@ def scan_config_patterns(
             ),
             remediation="Add reactStrictMode: true to next.config.js.",
         ))
-    elif re.search(r'reactStrictMode\s*:\s*false', content):
+    elif STRICT_MODE_DISABLED.search(content):
         findings.append(Finding(
             category=FindingCategory.config,
             severity=Severity.low,
@@ -109,7 +116,7 @@ def scan_config_patterns(
             ),
             remediation="Add poweredByHeader: false to next.config.js.",
         ))
-    elif re.search(r'poweredByHeader\s*:\s*true', content):
+    elif POWERED_BY_ENABLED.search(content):
         findings.append(Finding(
             category=FindingCategory.config,
             severity=Severity.low,
@@ -120,7 +127,7 @@ def scan_config_patterns(
         ))
 
     # 3. Security headers
-    has_headers_config = bool(re.search(r'async\s+headers\s*\(\s*\)', content))
+    has_headers_config = bool(HEADERS_FUNCTION.search(content))
     if not has_headers_config:
         findings.append(Finding(
             category=FindingCategory.config,
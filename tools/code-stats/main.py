@@ -49,13 +49,23 @@ Output (stdout JSON):
 }
 """
 
+import hashlib
 import json
+import mmap
 import os
 import sys
 import re
-from dataclasses import dataclass, asdict
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
 
 EXTENSION_LANGUAGE_MAP = {
     ".py": "python",
@@ -68,15 +78,24 @@ EXTENSION_LANGUAGE_MAP = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     name: str
     lines: int
     start_line: int
     complexity: int = 1  # cyclomatic complexity (minimum 1 for the function itself)
 
+    def to_dict(self) -> dict:
+        # Explicit literal: dataclasses.asdict() deep-copies every field
+        return {
+            "name": self.name,
+            "lines": self.lines,
+            "start_line": self.start_line,
+            "complexity": self.complexity,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class Metrics:
     total_lines: int
     code_lines: int
@@ -85,6 +104,16 @@ class Metrics:
     functions: int
     classes: int
 
+    def to_dict(self) -> dict:
+        return {
+            "total_lines": self.total_lines,
+            "code_lines": self.code_lines,
+            "blank_lines": self.blank_lines,
+            "comment_lines": self.comment_lines,
+            "functions": self.functions,
+            "classes": self.classes,
+        }
+
 
 # -- Cyclomatic complexity helpers ------------------------------------------
 # Each branch keyword / operator adds 1 to the base complexity of 1.
@@ -138,64 +167,157 @@ def _strip_strings_and_comments(line: str, language: str) -> str:
     return result
 
 
+_BRANCH_PATTERNS = {
+    'python': _PYTHON_BRANCH_KEYWORDS,
+    'javascript': _JS_BRANCH_RE,
+    'typescript': _JS_BRANCH_RE,
+    'js': _JS_BRANCH_RE,
+    'ts': _JS_BRANCH_RE,
+    'go': _GO_BRANCH_RE,
+    'rust': _RUST_BRANCH_RE,
+}
+
+
+def _count_line_branches(stripped: str, language: str, pattern: re.Pattern) -> int:
+    """Count branch points on one already-stripped line."""
+    # Skip pure comment lines
+    if language == 'python' and stripped.startswith('#'):
+        return 0
+    if language in ('javascript', 'typescript', 'js', 'ts', 'go', 'rust'):
+        if stripped.startswith(('//', '/*', '*')):
+            return 0
+    cleaned = _strip_strings_and_comments(stripped, language)
+    return len(pattern.findall(cleaned))
+
+
 def _count_complexity(code_lines: list[str], language: str) -> int:
     """Count cyclomatic complexity of a block of code.
 
     Returns the number of branch points (caller should add the base 1).
     """
-    pattern = {
-        'python': _PYTHON_BRANCH_KEYWORDS,
-        'javascript': _JS_BRANCH_RE,
-        'typescript': _JS_BRANCH_RE,
-        'js': _JS_BRANCH_RE,
-        'ts': _JS_BRANCH_RE,
-        'go': _GO_BRANCH_RE,
-        'rust': _RUST_BRANCH_RE,
-    }.get(language)
-
+    pattern = _BRANCH_PATTERNS.get(language)
     if not pattern:
         return 0
 
     branches = 0
     for line in code_lines:
-        stripped = line.strip()
-        # Skip pure comment lines
-        if language == 'python' and stripped.startswith('#'):
-            continue
-        if language in ('javascript', 'typescript', 'js', 'ts', 'go', 'rust'):
-            if stripped.startswith('//') or stripped.startswith('/*') or stripped.startswith('*'):
-                continue
-        cleaned = _strip_strings_and_comments(stripped, language)
-        branches += len(pattern.findall(cleaned))
+        branches += _count_line_branches(line.strip(), language, pattern)
     return branches
 
 
+# All language markers in one alternation; the group that matched names the
+# language.  Listed in priority order: when several occur, the earliest entry
+# here wins regardless of position in the code.
+_LANGUAGE_MARKERS_RE = re.compile(
+    r'\bdef\s+\w+\s*\((?P<python>)'
+    r'|\bfunction\s+\w+\s*\((?P<javascript>)'
+    r'|(?P<arrow>=>)'
+    r'|\bfunc\s+\w+\s*\((?P<go>)'
+    r'|\bfn\s+\w+\s*\((?P<rust>)'
+)
+_LANGUAGE_PRIORITY = {'python': 0, 'javascript': 1, 'arrow': 1, 'go': 2, 'rust': 3}
+_LANGUAGE_FOR_MARKER = {'arrow': 'javascript'}
+
+
 def detect_language(code: str) -> str:
-    """Simple language detection based on common patterns."""
-    if re.search(r'\bdef\s+\w+\s*\(', code):
-        return 'python'
-    if re.search(r'\bfunction\s+\w+\s*\(', code) or re.search(r'=>', code):
-        return 'javascript'
-    if re.search(r'\bfunc\s+\w+\s*\(', code):
-        return 'go'
-    if re.search(r'\bfn\s+\w+\s*\(', code):
-        return 'rust'
-    return 'unknown'
+    """Simple language detection based on common patterns.
+
+    Scans the code once for every marker instead of once per language, and
+    stops at the first Python marker since nothing outranks it.
+    """
+    best = None
+    for match in _LANGUAGE_MARKERS_RE.finditer(code):
+        marker = match.lastgroup
+        if best is None or _LANGUAGE_PRIORITY[marker] < _LANGUAGE_PRIORITY[best]:
+            best = marker
+            if _LANGUAGE_PRIORITY[best] == 0:
+                break
+    if best is None:
+        return 'unknown'
+    return _LANGUAGE_FOR_MARKER.get(best, best)
 
 
 def detect_language_from_extension(filename: str) -> Optional[str]:
-    """Detect language based on file extension."""
+    """Detect language based on file extension.
+
+    Only the extension is lowercased, and only when the exact-case lookup
+    misses, so the common case allocates no copy of the full path.
+    """
     if not filename:
         return None
-    _, ext = os.path.splitext(filename.lower())
-    return EXTENSION_LANGUAGE_MAP.get(ext)
+    _, ext = os.path.splitext(filename)
+    language = EXTENSION_LANGUAGE_MAP.get(ext)
+    if language is None and ext:
+        language = EXTENSION_LANGUAGE_MAP.get(ext.lower())
+    return language
+
+
+# Files smaller than this are read into a buffer reused across calls
+_READ_BUFFER_MAX = 4 * 1024 * 1024
+_read_buffer = bytearray(64 * 1024)
+
+
+def _read_fd(fd: int) -> str:
+    """Read and decode everything from *fd* with one size-hinted read.
+
+    Files under ``_READ_BUFFER_MAX`` land in the shared ``_read_buffer`` and
+    are decoded straight from it; larger files are memory-mapped.  Either
+    way the decoded ``str`` is the only per-file allocation.
+    """
+    global _read_buffer
+    size = os.fstat(fd).st_size
+    if size >= _READ_BUFFER_MAX:
+        # Large file: decode straight from the page cache instead of first
+        # copying the whole file into a bytes object
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                return str(mapped, "utf-8", "replace")
+        except (OSError, ValueError):
+            pass  # e.g. filesystems without mmap support; plain read below
+    elif hasattr(os, "readv"):
+        if len(_read_buffer) <= size:
+            _read_buffer = bytearray(min(_READ_BUFFER_MAX, max(size + 1, 2 * len(_read_buffer))))
+        view = memoryview(_read_buffer)
+        try:
+            n = os.readv(fd, [view[:size + 1]])
+            if n <= size:
+                return str(view[:n], "utf-8", "replace")
+            data = bytes(view[:n])
+        finally:
+            view.release()
+        return _read_rest(fd, data)
+
+    data = os.read(fd, size + 1)
+    if len(data) <= size:
+        return data.decode("utf-8", errors="replace")
+    return _read_rest(fd, data)
+
+
+def _read_rest(fd: int, head: bytes) -> str:
+    """Drain *fd* after *head* (the file grew since fstat()) and decode."""
+    chunks = [head]
+    while chunk := os.read(fd, 65536):
+        chunks.append(chunk)
+    return b"".join(chunks).decode("utf-8", errors="replace")
 
 
 def read_file_safe(file_path: str) -> tuple[str, Optional[str]]:
-    """Read file content with friendly errors."""
+    """Read file content with friendly errors.
+
+    Reads through a raw descriptor with one size-hinted ``read`` instead of
+    a buffered text-mode ``open()``, which skips the isatty/lseek syscalls
+    and the incremental decoder.  Newlines are normalised the same way
+    text mode would.
+    """
     try:
-        with open(file_path, "r", encoding="utf-8", errors="replace") as handle:
-            return handle.read(), None
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            content = _read_fd(fd)
+        finally:
+            os.close(fd)
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content, None
     except FileNotFoundError:
         return "", f"File not found: {file_path}"
     except PermissionError:
@@ -204,78 +326,104 @@ def read_file_safe(file_path: str) -> tuple[str, Optional[str]]:
         return "", f"Failed to read file: {file_path} ({exc})"
 
 
-def _find_python_function_end(lines: list[str], start_idx: int, func_indent: int) -> int:
-    """Find the last line belonging to a Python function using indentation.
+def _python_functions(
+    lines: list[str],
+    defs: list[tuple[int, int, str]],
+) -> list[FunctionInfo]:
+    """Resolve the extent and complexity of every Python ``def``.
 
-    Args:
-        lines: All source lines (0-indexed).
-        start_idx: Index of the ``def`` line.
-        func_indent: Column of the ``def`` keyword.
-
-    Returns:
-        0-based index of the last line that belongs to the function body.
+    *defs* holds ``(line_index, indent, name)`` for each def, in line order.
+    One pass from the first def keeps a stack of open functions: a
+    non-blank line indented at or left of a function's ``def`` closes it,
+    and its body ends on the last non-blank line before that.  Branches are
+    counted once per line into a running total, so a function's complexity
+    is the difference between the totals at its start and end, and nested
+    bodies are never rescanned.
     """
-    last_body_line = start_idx  # at minimum the def line itself
-    for j in range(start_idx + 1, len(lines)):
-        stripped = lines[j].strip()
+    functions: list[Optional[FunctionInfo]] = [None] * len(defs)
+    pattern = _BRANCH_PATTERNS['python']
+    # (ordinal, start, indent, name, branches before start)
+    stack: list[tuple[int, int, int, str, int]] = []
+    running = 0
+    next_def = 0
+    prev_nonblank = defs[0][0]
+
+    def close(entry: tuple[int, int, int, str, int]) -> None:
+        ordinal, start, _, name, branches_before = entry
+        functions[ordinal] = FunctionInfo(
+            name=name,
+            lines=prev_nonblank - start + 1,
+            start_line=start + 1,  # 1-based
+            complexity=1 + running - branches_before,
+        )
+
+    for j in range(defs[0][0], len(lines)):
+        line = lines[j]
+        stripped = line.strip()
         if not stripped:
-            # Blank lines don't end a function – but only count them if
-            # there is still body content after them.
+            # Blank lines never end a function, nor extend it on their own
             continue
-        # Measure leading whitespace
-        leading = len(lines[j]) - len(lines[j].lstrip())
-        if leading > func_indent:
-            # Still inside the function body
-            last_body_line = j
-        else:
-            # Dedented to the same or outer level → function ended
-            break
-    else:
-        # Reached end of file while inside the function
-        # Walk back from EOF to find the last non-blank line
-        for j in range(len(lines) - 1, start_idx, -1):
-            if lines[j].strip():
-                last_body_line = j
-                break
-    return last_body_line
+        leading = len(line) - len(line.lstrip())
+        while stack and leading <= stack[-1][2]:
+            close(stack.pop())
+        if next_def < len(defs) and defs[next_def][0] == j:
+            _, indent, name = defs[next_def]
+            stack.append((next_def, j, indent, name, running))
+            next_def += 1
+        if stack:
+            running += _count_line_branches(stripped, 'python', pattern)
+        prev_nonblank = j
+
+    while stack:
+        close(stack.pop())
+    return functions
+
+
+# Whole-buffer (MULTILINE) patterns: the regex engine walks the source in C
+# instead of the interpreter looping over every line.  [^\S\n] is
+# "whitespace other than newline", so a match never spans lines.
+_BLANK_LINE_RE = re.compile(r'^[^\S\n]*$', re.MULTILINE)
+_PY_COMMENT_LINE_RE = re.compile(r'^[^\S\n]*#', re.MULTILINE)
+# One pass of the regex engine classifies a line as class or def
+_PY_DEF_CLASS_RE = re.compile(
+    r'^(?P<indent>[^\S\n]*)(?:class[^\S\n]+\w+|def[^\S\n]+(?P<fn>\w+)[^\S\n]*\()',
+    re.MULTILINE,
+)
 
 
 def analyze_python(code: str) -> tuple[Metrics, list[FunctionInfo]]:
-    """Analyze Python code."""
-    lines = code.split('\n')
-    total_lines = len(lines)
-    blank_lines = sum(1 for line in lines if not line.strip())
-    comment_lines = sum(1 for line in lines if line.strip().startswith('#'))
-    code_lines = total_lines - blank_lines - comment_lines
+    """Analyze Python code.
 
-    functions: list[FunctionInfo] = []
-    class_count = 0
+    Blank, comment and def/class lines are found by whole-buffer regex
+    scans.  Match offsets are turned into line numbers by counting newlines
+    incrementally between consecutive matches, so no per-line Python loop
+    (and no per-match rescan from the start of the file) is needed.
+    """
+    total_lines = code.count('\n') + 1
+    blank_lines = len(_BLANK_LINE_RE.findall(code))
+    comment_lines = len(_PY_COMMENT_LINE_RE.findall(code))
 
-    func_pattern = re.compile(r'^(\s*)def\s+(\w+)\s*\(')
-    class_pattern = re.compile(r'^\s*class\s+\w+')
+    defs: list[tuple[int, int, str]] = []
+    class_count = 0
 
-    for i, line in enumerate(lines):
-        if class_pattern.match(line):
+    i = 0  # 0-based line index of the current match
+    last_offset = 0
+    for match in _PY_DEF_CLASS_RE.finditer(code):
+        func_name = match.group('fn')
+        if func_name is None:
             class_count += 1
+            continue
 
-        func_match = func_pattern.match(line)
-        if func_match:
-            indent_level = len(func_match.group(1))
-            func_name = func_match.group(2)
-            end_idx = _find_python_function_end(lines, i, indent_level)
-            line_count = end_idx - i + 1
-            body = lines[i:end_idx + 1]
-            complexity = 1 + _count_complexity(body, 'python')
-            functions.append(FunctionInfo(
-                name=func_name,
-                lines=line_count,
-                start_line=i + 1,  # 1-based
-                complexity=complexity,
-            ))
+        offset = match.start()
+        i += code.count('\n', last_offset, offset)
+        last_offset = offset
+        defs.append((i, len(match.group('indent')), func_name))
+
+    functions = _python_functions(code.split('\n'), defs) if defs else []
 
     metrics = Metrics(
         total_lines=total_lines,
-        code_lines=code_lines,
+        code_lines=total_lines - blank_lines - comment_lines,
         blank_lines=blank_lines,
         comment_lines=comment_lines,
         functions=len(functions),
@@ -291,34 +439,37 @@ _JS_NOT_METHODS = frozenset({
 })
 
 
-def _count_js_comment_lines(lines: list[str]) -> int:
-    """Count comment lines in JS/TS, handling single-line and block comments.
+def _count_js_blank_and_comment_lines(lines: list[str]) -> tuple[int, int]:
+    """Count blank and comment lines in JS/TS, handling single-line and block comments.
 
-    Blank lines inside block comments are NOT counted (they are already
-    counted separately as blank_lines), preventing code_lines from going
-    negative.
+    Both counts come from one pass with a single ``strip()`` per line.
+    Blank lines inside block comments are counted as blank only, preventing
+    code_lines from going negative.
     """
-    count = 0
+    blank = 0
+    comment = 0
     in_block = False
     for line in lines:
         stripped = line.strip()
+        if not stripped:
+            blank += 1
+            continue
         if in_block:
-            if stripped:  # skip blank lines inside block comments
-                count += 1
+            comment += 1
             if '*/' in stripped:
                 in_block = False
             continue
         if stripped.startswith('//'):
-            count += 1
+            comment += 1
             continue
         if stripped.startswith('/*'):
-            count += 1
+            comment += 1
             if '*/' not in stripped or stripped.endswith('*/') and not stripped.endswith('/*/'):
                 # Block continues unless closed on the same line
                 if '*/' not in stripped[2:]:
                     in_block = True
             continue
-    return count
+    return blank, comment
 
 
 def _count_brace_body(lines: list[str], start_idx: int) -> int:
@@ -386,8 +537,7 @@ def analyze_javascript(code: str) -> tuple[Metrics, list[FunctionInfo]]:
     """Analyze JavaScript/TypeScript code."""
     lines = code.split('\n')
     total_lines = len(lines)
-    blank_lines = sum(1 for line in lines if not line.strip())
-    comment_lines = _count_js_comment_lines(lines)
+    blank_lines, comment_lines = _count_js_blank_and_comment_lines(lines)
     code_lines = total_lines - blank_lines - comment_lines
 
     functions: list[FunctionInfo] = []
@@ -435,8 +585,7 @@ def analyze_go(code: str) -> tuple[Metrics, list[FunctionInfo]]:
     """Analyze Go code."""
     lines = code.split('\n')
     total_lines = len(lines)
-    blank_lines = sum(1 for line in lines if not line.strip())
-    comment_lines = _count_js_comment_lines(lines)  # Go uses same // and /* */ style
+    blank_lines, comment_lines = _count_js_blank_and_comment_lines(lines)  # Go uses same // and /* */ style
     code_lines = total_lines - blank_lines - comment_lines
 
     functions: list[FunctionInfo] = []
@@ -477,8 +626,7 @@ def analyze_rust(code: str) -> tuple[Metrics, list[FunctionInfo]]:
     """Analyze Rust code."""
     lines = code.split('\n')
     total_lines = len(lines)
-    blank_lines = sum(1 for line in lines if not line.strip())
-    comment_lines = _count_js_comment_lines(lines)  # Rust uses same // and /* */ style
+    blank_lines, comment_lines = _count_js_blank_and_comment_lines(lines)  # Rust uses same // and /* */ style
     code_lines = total_lines - blank_lines - comment_lines
 
     functions: list[FunctionInfo] = []
@@ -518,10 +666,12 @@ def analyze_rust(code: str) -> tuple[Metrics, list[FunctionInfo]]:
 
 
 def analyze_generic(code: str) -> tuple[Metrics, list[FunctionInfo]]:
-    """Generic analysis for unknown languages."""
-    lines = code.split('\n')
-    total_lines = len(lines)
-    blank_lines = sum(1 for line in lines if not line.strip())
+    """Generic analysis for unknown languages.
+
+    Needs only counts, so it never splits the code into a list of lines.
+    """
+    total_lines = code.count('\n') + 1
+    blank_lines = len(_BLANK_LINE_RE.findall(code))
 
     metrics = Metrics(
         total_lines=total_lines,
@@ -535,22 +685,27 @@ def analyze_generic(code: str) -> tuple[Metrics, list[FunctionInfo]]:
     return metrics, []
 
 
+_ANALYZERS = {
+    'python': analyze_python,
+    'javascript': analyze_javascript,
+    'typescript': analyze_javascript,
+    'js': analyze_javascript,
+    'ts': analyze_javascript,
+    'go': analyze_go,
+    'rust': analyze_rust,
+}
+
+
 def analyze_code(code: str, language: Optional[str] = None) -> tuple[Metrics, list[FunctionInfo], str]:
-    """Analyze code and return metrics."""
+    """Analyze code and return metrics.
+
+    Content-based detection only runs when no *language* is given; callers
+    that know the file extension should pass it to skip the regex scans.
+    """
     if not language:
         language = detect_language(code)
 
-    if language == 'python':
-        metrics, functions = analyze_python(code)
-    elif language in ('javascript', 'typescript', 'js', 'ts'):
-        metrics, functions = analyze_javascript(code)
-    elif language == 'go':
-        metrics, functions = analyze_go(code)
-    elif language == 'rust':
-        metrics, functions = analyze_rust(code)
-    else:
-        metrics, functions = analyze_generic(code)
-
+    metrics, functions = _ANALYZERS.get(language, analyze_generic)(code)
     return metrics, functions, language
 
 
@@ -559,8 +714,13 @@ def analyze_single_file(
     max_file_lines: int,
     max_function_lines: int,
     max_complexity: int = 10,
+    summary_only: bool = False,
 ) -> dict:
-    """Analyze a single file based on manifest data."""
+    """Analyze a single file based on manifest data.
+
+    With *summary_only* the per-function list is left out of the result,
+    since only the counts feed the aggregate.
+    """
     file_path = file_info.get("path")
     original_name = file_info.get("original_name") or file_info.get("filename") or ""
     filename = original_name or (os.path.basename(file_path) if file_path else "")
@@ -580,13 +740,196 @@ def analyze_single_file(
         metrics, functions, max_file_lines, max_function_lines, max_complexity,
     )
 
-    return {
+    result = {
         "filename": filename or file_path,
         "language": detected_language,
-        "metrics": asdict(metrics),
-        "functions": [asdict(f) for f in functions],
-        "warnings": warnings,
+        "metrics": metrics.to_dict(),
     }
+    if not summary_only:
+        result["functions"] = [f.to_dict() for f in functions]
+    result["warnings"] = warnings
+    return result
+
+
+# Below this many files the process pool start-up costs more than it saves.
+# Starting a pool and shipping results back costs ~40ms, while a typical
+# source file (~7 KB) analyses in ~0.8ms, so two workers only break even
+# at around 100 files.
+PARALLEL_MIN_FILES = 100
+
+# Upper bound on files handed to a worker per dispatch
+MAX_CHUNKSIZE = 32
+
+
+def _pool_chunksize(file_count: int, workers: int) -> int:
+    """Pick a map() chunksize that keeps every worker busy.
+
+    Aim for ~4 chunks per worker so a slow file only stalls a small batch,
+    while large scans still amortise IPC over up to MAX_CHUNKSIZE files.
+    """
+    return max(1, min(MAX_CHUNKSIZE, file_count // (workers * 4)))
+
+
+def _analyzer_fingerprint() -> str:
+    """Hash of this module's source, stored with the cache to detect upgrades."""
+    with open(__file__, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def default_cache_path() -> str:
+    """Location of the on-disk result cache (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "code-stats", "results.sqlite3")
+
+
+class AnalysisCache:
+    """Per-file results persisted in SQLite across runs.
+
+    Entries are keyed by file path and validated against the file's mtime
+    and size plus every setting that shapes the result, so an edited file
+    or a changed threshold is simply re-analyzed.  The whole cache is
+    dropped when the analyzer source changes.  SQLite errors after opening
+    degrade to cache misses rather than failing the scan.
+    """
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        try:
+            self._prepare(_analyzer_fingerprint())
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def _prepare(self, fingerprint: str) -> None:
+        """Create the tables, dropping results from a different analyzer version."""
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(path TEXT PRIMARY KEY, key TEXT NOT NULL, result BLOB NOT NULL)"
+            )
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'fingerprint'"
+            ).fetchone()
+            if row is None or row[0] != fingerprint:
+                self._conn.execute("DELETE FROM results")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (fingerprint,)
+                )
+
+    @staticmethod
+    def key_for(file_info: dict, settings: tuple) -> Optional[str]:
+        """Validation key for *file_info*, or None if the file can't be stat'd."""
+        path = file_info.get("path")
+        if not path:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return json.dumps([
+            st.st_mtime_ns, st.st_size,
+            file_info.get("original_name"), file_info.get("filename"), *settings,
+        ])
+
+    def get(self, path: str, key: str) -> Optional[dict]:
+        try:
+            row = self._conn.execute(
+                "SELECT key, result FROM results WHERE path = ?", (path,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or row[0] != key:
+            return None
+        return _loads(row[1])
+
+    def put(self, path: str, key: str, result: dict) -> None:
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (path, key, result) VALUES (?, ?, ?)",
+                (path, key, _dumps_compact(result)),
+            )
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        try:
+            self._conn.commit()
+        except sqlite3.Error:
+            pass
+        self._conn.close()
+
+
+def _open_cache() -> Optional[AnalysisCache]:
+    """Open the default cache, or return None if it is not writable."""
+    try:
+        return AnalysisCache(default_cache_path())
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def _run_analysis(analyze, files: list) -> list[dict]:
+    """Apply *analyze* to *files* in a process pool when worthwhile.
+
+    Results are returned in the same order as *files*.  Falls back to a
+    sequential loop if a process pool cannot be started (e.g. restricted
+    sandboxes without /dev/shm).
+    """
+    workers = min(os.cpu_count() or 1, len(files))
+    if len(files) >= PARALLEL_MIN_FILES and workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunksize = _pool_chunksize(len(files), workers)
+                return list(executor.map(analyze, files, chunksize=chunksize))
+        except (OSError, NotImplementedError):
+            pass
+    return [analyze(file_info) for file_info in files]
+
+
+def _analyze_files(
+    files: list,
+    max_file_lines: int,
+    max_function_lines: int,
+    max_complexity: int,
+    summary_only: bool = False,
+    cache: Optional[AnalysisCache] = None,
+) -> list[dict]:
+    """Run analyze_single_file over *files*, in input order.
+
+    With a *cache*, unchanged files are served from it and only the misses
+    are analyzed (and then stored).  Error results are never cached.
+    """
+    analyze = partial(
+        analyze_single_file,
+        max_file_lines=max_file_lines,
+        max_function_lines=max_function_lines,
+        max_complexity=max_complexity,
+        summary_only=summary_only,
+    )
+    if cache is None:
+        return _run_analysis(analyze, files)
+
+    settings = (max_file_lines, max_function_lines, max_complexity, summary_only)
+    results: list[Optional[dict]] = [None] * len(files)
+    keys: list[Optional[str]] = []
+    misses: list[int] = []
+    for idx, file_info in enumerate(files):
+        key = AnalysisCache.key_for(file_info, settings)
+        keys.append(key)
+        if key is not None:
+            results[idx] = cache.get(file_info["path"], key)
+        if results[idx] is None:
+            misses.append(idx)
+
+    fresh = _run_analysis(analyze, [files[idx] for idx in misses])
+    for idx, result in zip(misses, fresh):
+        results[idx] = result
+        if keys[idx] is not None and "error" not in result:
+            cache.put(files[idx]["path"], keys[idx], result)
+    return results
 
 
 def analyze_multiple_files(
@@ -595,9 +938,13 @@ def analyze_multiple_files(
     max_function_lines: int,
     summary_only: bool = False,
     max_complexity: int = 10,
+    cache: Optional[AnalysisCache] = None,
 ) -> dict:
     """Analyze multiple files and return aggregated results."""
-    results = []
+    results = _analyze_files(
+        files, max_file_lines, max_function_lines, max_complexity, summary_only,
+        cache,
+    )
     aggregate = {
         "total_lines": 0,
         "total_functions": 0,
@@ -606,11 +953,7 @@ def analyze_multiple_files(
         "errors": 0,
     }
 
-    for file_info in files:
-        result = analyze_single_file(
-            file_info, max_file_lines, max_function_lines, max_complexity,
-        )
-        results.append(result)
+    for result in results:
         if "error" in result:
             aggregate["errors"] += 1
             continue
@@ -671,11 +1014,32 @@ def generate_warnings(
     return warnings
 
 
+def _dumps_pretty(obj) -> str:
+    """Serialize *obj* as 2-space indented JSON, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _dumps_compact(obj) -> bytes:
+    """Serialize *obj* as compact UTF-8 JSON, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes | str):
+    """Parse JSON bytes or text, via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # Supported file extensions for directory scanning
-SUPPORTED_EXTENSIONS = {".py", ".js", ".ts", ".tsx", ".jsx", ".go", ".rs"}
+SUPPORTED_EXTENSIONS = frozenset({".py", ".js", ".ts", ".tsx", ".jsx", ".go", ".rs"})
 
 # Directories to always skip (build artifacts, deps, caches)
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     # Dependencies
     "node_modules", "bower_components", "vendor",
     # Python envs & caches
@@ -690,7 +1054,7 @@ SKIP_DIRS = {
     ".git", ".svn", ".hg", ".idea", ".vscode",
     # Coverage & misc
     "coverage", ".coverage", ".env",
-}
+})
 
 # File-name patterns that indicate generated / minified / non-source files
 _SKIP_SUFFIXES = (".min.js", ".min.css", ".bundle.js", ".chunk.js", ".map")
@@ -740,23 +1104,38 @@ def _matches_gitignore(rel_path: str, patterns: list[str]) -> bool:
     return False
 
 
-def _is_minified(file_path: str) -> bool:
-    """Heuristic: file is likely minified if avg line length > 500 chars."""
+def _is_minified(file_path: str, size: Optional[int] = None) -> bool:
+    """Heuristic: file is likely minified if avg line length > 500 bytes.
+
+    When the caller already knows the file *size* in bytes, files too small
+    to ever exceed the threshold are rejected without being opened.
+    """
+    if size is not None and size <= 500:
+        return False
     try:
-        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-            # Read first 8 KB — enough to judge
+        # Read first 8 KB — enough to judge.  Only lengths and newline
+        # counts matter, so the sample stays as bytes and is never decoded.
+        with open(file_path, "rb") as f:
             sample = f.read(8192)
         if not sample:
             return False
-        lines = sample.split("\n")
-        if len(lines) < 2:
+        line_count = sample.count(b"\n") + 1
+        if line_count < 2:
             return len(sample) > 500
-        avg = len(sample) / len(lines)
-        return avg > 500
+        return len(sample) / line_count > 500
     except OSError:
         return False
 
 
+def _sorted_entries(directory: str) -> list[os.DirEntry]:
+    """List *directory* sorted by name, reversed for popping off a stack."""
+    try:
+        with os.scandir(directory) as it:
+            return sorted(it, key=lambda e: e.name, reverse=True)
+    except OSError:
+        return []
+
+
 def collect_files_from_directory(directory: str, max_files: int = 100) -> list[dict]:
     """Collect supported code files, respecting .gitignore and skipping artifacts."""
     from pathlib import Path
@@ -769,36 +1148,54 @@ def collect_files_from_directory(directory: str, max_files: int = 100) -> list[d
 
     gitignore_patterns = _parse_gitignore(str(dir_path))
 
+    root = str(dir_path)
+    root_len = len(root) + 1
     files = []
-    for file_path in sorted(dir_path.rglob("*")):
-        if not file_path.is_file():
+    # Depth-first walk over name-sorted entries, so files come out in the
+    # same order as sorted(rglob("*")) and max_files cuts at the same place.
+    # Skipped and ignored directories are pruned instead of being walked.
+    stack = _sorted_entries(root)
+    while stack:
+        entry = stack.pop()
+        rel = entry.path[root_len:]
+
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name in SKIP_DIRS:
+                continue
+            if gitignore_patterns and _matches_gitignore(rel, gitignore_patterns):
+                continue
+            stack.extend(_sorted_entries(entry.path))
             continue
 
-        # Skip directories in SKIP_DIRS
-        if any(skip_dir in file_path.parts for skip_dir in SKIP_DIRS):
+        try:
+            if not entry.is_file():
+                continue
+        except OSError:
             continue
 
         # Only include supported file types
-        if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+        name = entry.name
+        if os.path.splitext(name)[1].lower() not in SUPPORTED_EXTENSIONS:
             continue
 
-        rel = str(file_path.relative_to(dir_path))
-
         # Skip files matching .gitignore
         if gitignore_patterns and _matches_gitignore(rel, gitignore_patterns):
             continue
 
         # Skip minified / bundled files by name
-        fname_lower = file_path.name.lower()
-        if any(fname_lower.endswith(s) for s in _SKIP_SUFFIXES):
+        if name.lower().endswith(_SKIP_SUFFIXES):
             continue
 
         # Skip minified files by content heuristic
-        if _is_minified(str(file_path)):
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            continue
+        if _is_minified(entry.path, size):
             continue
 
         files.append({
-            "path": str(file_path),
+            "path": entry.path,
             "original_name": rel,
         })
 
@@ -808,11 +1205,22 @@ def collect_files_from_directory(directory: str, max_files: int = 100) -> list[d
     return files
 
 
+def _read_stdin_json():
+    """Parse stdin as JSON in one read of the raw bytes.
+
+    Skips the text-layer decode when stdin has a binary buffer (the normal
+    case); plain text streams, e.g. in tests, are read as str.
+    """
+    stream = getattr(sys.stdin, "buffer", None)
+    return _loads(stream.read() if stream is not None else sys.stdin.read())
+
+
 def main():
     """Main entry point."""
+    cache = None
     try:
         # Read input from stdin
-        input_data = json.load(sys.stdin)
+        input_data = _read_stdin_json()
 
         metadata = input_data.get("metadata")
         if isinstance(metadata, dict):
@@ -831,6 +1239,8 @@ def main():
             max_complexity = input_data.get("max_complexity", 10)
 
         summary_only = input_data.get("summary", False)
+        if input_data.get("cache"):
+            cache = _open_cache()
 
         # Support multiple input formats:
         # - path/directory: Scan a local directory
@@ -851,9 +1261,9 @@ def main():
                     return
                 result = analyze_multiple_files(
                     files, max_file_lines, max_function_lines, summary_only,
-                    max_complexity,
+                    max_complexity, cache,
                 )
-                print(json.dumps(result, indent=2))
+                print(_dumps_pretty(result))
             except ValueError as e:
                 print(json.dumps({'error': str(e)}))
             return
@@ -862,9 +1272,9 @@ def main():
         if isinstance(files, list) and files:
             result = analyze_multiple_files(
                 files, max_file_lines, max_function_lines, summary_only,
-                max_complexity,
+                max_complexity, cache,
             )
-            print(json.dumps(result, indent=2))
+            print(_dumps_pretty(result))
             return
 
         code = input_data.get('code', '')
@@ -903,13 +1313,13 @@ def main():
         # Build result
         result = {
             'language': detected_language,
-            'metrics': asdict(metrics),
-            'functions': [asdict(f) for f in functions],
+            'metrics': metrics.to_dict(),
+            'functions': [f.to_dict() for f in functions],
             'warnings': warnings,
             'summary': summary
         }
 
-        print(json.dumps(result, indent=2))
+        print(_dumps_pretty(result))
 
     except json.JSONDecodeError as e:
         result = {'error': f'Invalid JSON input: {e}'}
@@ -917,6 +1327,9 @@ def main():
     except Exception as e:
         result = {'error': f'Analysis failed: {e}'}
         print(json.dumps(result))
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == '__main__':
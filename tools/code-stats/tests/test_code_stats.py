@@ -1,6 +1,7 @@
 import io
 import json
 import os
+import sqlite3
 import sys
 from pathlib import Path
 
@@ -36,6 +37,8 @@ class TestDetectLanguageFromExtension:
             ("component.jsx", "javascript"),
             ("service.go", "go"),
             ("lib.rs", "rust"),
+            ("LEGACY.PY", "python"),
+            ("src/App.Tsx", "typescript"),
             ("README.md", None),
             ("", None),
         ],
@@ -106,6 +109,31 @@ class TestAnalyzePython:
         assert "outer" in names
         assert "inner" in names
 
+    def test_nested_function_extents(self):
+        code = "\n".join([
+            "def outer(x):",
+            "    if x:",
+            "        pass",
+            "    def inner(y):",
+            "        if y:",
+            "            return 1",
+            "",
+            "    return inner",
+            "",
+            "def after():",
+            "    pass",
+        ])
+        _, functions = main.analyze_python(code)
+
+        by_name = {f.name: f for f in functions}
+        assert [f.name for f in functions] == ["outer", "inner", "after"]
+        assert by_name["outer"].lines == 8
+        assert by_name["outer"].complexity == 3  # own if + inner's if
+        assert by_name["inner"].start_line == 4
+        assert by_name["inner"].lines == 3
+        assert by_name["inner"].complexity == 2
+        assert by_name["after"].lines == 2
+
     def test_multiline_function_body(self):
         code = "\n".join([
             "def long_func():",
@@ -163,6 +191,20 @@ class TestAnalyzePython:
         metrics, _ = main.analyze_python(code)
         assert metrics.classes == 1
 
+    def test_keyword_before_line_break_not_counted(self):
+        """A bare class/def whose name is on the next line is not a definition."""
+        code = "\n".join([
+            "class",
+            "B:",
+            "    def",
+            "  h(self):",
+            "        pass",
+        ])
+        metrics, functions = main.analyze_python(code)
+        assert metrics.classes == 0
+        assert metrics.functions == 0
+        assert functions == []
+
 
 class TestAnalyzeJavaScript:
     def test_basic_metrics(self):
@@ -478,6 +520,16 @@ class TestAnalyzeCode:
         assert lang == "ts"
         assert metrics.functions == 1
 
+    def test_language_hint_skips_detection(self, monkeypatch):
+        def fail_detect(code):
+            raise AssertionError("detect_language should not run with a hint")
+
+        monkeypatch.setattr(main, "detect_language", fail_detect)
+        metrics, _, lang = main.analyze_code("def foo():\n    pass", "python")
+
+        assert lang == "python"
+        assert metrics.functions == 1
+
 
 class TestGenerateWarnings:
     def test_generate_warnings(self):
@@ -521,6 +573,17 @@ class TestGenerateWarnings:
         assert any("'b'" in w for w in warnings)
 
 
+class TestSerialization:
+    def test_to_dict_matches_asdict(self):
+        from dataclasses import asdict
+
+        metrics = main.Metrics(10, 7, 2, 1, 1, 0)
+        func = main.FunctionInfo(name="foo", lines=5, start_line=2, complexity=3)
+
+        assert metrics.to_dict() == asdict(metrics)
+        assert func.to_dict() == asdict(func)
+
+
 class TestReadFileSafe:
     def test_read_file_safe_success(self, tmp_path: Path):
         file_path = tmp_path / "sample.py"
@@ -538,6 +601,37 @@ class TestReadFileSafe:
         assert content == ""
         assert error == f"File not found: {file_path}"
 
+    def test_read_file_safe_normalises_newlines(self, tmp_path: Path):
+        file_path = tmp_path / "crlf.py"
+        file_path.write_bytes(b"def foo():\r\n    pass\rx = 1\n")
+
+        content, error = main.read_file_safe(str(file_path))
+
+        assert error is None
+        assert content == "def foo():\n    pass\nx = 1\n"
+
+    def test_read_file_safe_reuses_buffer_across_sizes(self, tmp_path: Path):
+        big = tmp_path / "big.py"
+        big.write_text("x = 'é'\n" * 20_000, encoding="utf-8")
+        small = tmp_path / "small.py"
+        small.write_text("y = 2\n", encoding="utf-8")
+
+        big_content, _ = main.read_file_safe(str(big))
+        small_content, _ = main.read_file_safe(str(small))
+
+        assert big_content == "x = 'é'\n" * 20_000
+        assert small_content == "y = 2\n"
+
+    def test_read_file_safe_large_file_mapped(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(main, "_READ_BUFFER_MAX", 1024)
+        file_path = tmp_path / "large.py"
+        file_path.write_text("def f():\r\n    return 'é'\r\n" * 200, encoding="utf-8")
+
+        content, error = main.read_file_safe(str(file_path))
+
+        assert error is None
+        assert content == "def f():\n    return 'é'\n" * 200
+
     def test_read_file_safe_permission(self, tmp_path: Path):
         file_path = tmp_path / "private.py"
         file_path.write_text("print('secret')", encoding="utf-8")
@@ -566,6 +660,19 @@ class TestAnalyzeSingleFile:
         assert result["metrics"]["total_lines"] == 2
         assert len(result["warnings"]) == 2
 
+    def test_summary_only_omits_functions(self, tmp_path: Path):
+        file_path = tmp_path / "sample.py"
+        file_path.write_text("def foo():\n    pass", encoding="utf-8")
+        file_info = {"path": str(file_path), "original_name": "sample.py"}
+
+        result = main.analyze_single_file(
+            file_info, max_file_lines=1, max_function_lines=1, summary_only=True,
+        )
+
+        assert "functions" not in result
+        assert result["metrics"]["functions"] == 1
+        assert len(result["warnings"]) == 2
+
 
 class TestAnalyzeMultipleFiles:
     def test_analyze_multiple_files(self, tmp_path: Path):
@@ -592,6 +699,98 @@ class TestAnalyzeMultipleFiles:
         assert result["aggregate"]["total_warnings"] == 0
         assert result["summary"].startswith("3 files analyzed.")
 
+    def test_parallel_results_keep_input_order(self, tmp_path: Path):
+        files = []
+        for i in range(main.PARALLEL_MIN_FILES * 3):
+            path = tmp_path / f"mod{i}.py"
+            path.write_text(f"def f{i}():\n    pass", encoding="utf-8")
+            files.append({"path": str(path), "original_name": path.name})
+
+        result = main.analyze_multiple_files(files, max_file_lines=300, max_function_lines=50)
+
+        assert [r["filename"] for r in result["results"]] == [f["original_name"] for f in files]
+        assert result["aggregate"]["total_functions"] == len(files)
+
+    @pytest.mark.parametrize(
+        ("file_count", "workers", "expected"),
+        [
+            (4, 4, 1),
+            (100, 4, 6),
+            (10_000, 8, main.MAX_CHUNKSIZE),
+        ],
+    )
+    def test_pool_chunksize(self, file_count, workers, expected):
+        assert main._pool_chunksize(file_count, workers) == expected
+
+
+class TestAnalysisCache:
+    def _files(self, tmp_path: Path) -> list[dict]:
+        paths = []
+        for name, body in (("a.py", "def a():\n    pass"), ("b.py", "def b():\n    pass")):
+            path = tmp_path / name
+            path.write_text(body, encoding="utf-8")
+            paths.append({"path": str(path), "original_name": name})
+        return paths
+
+    def test_unchanged_files_served_from_cache(self, tmp_path: Path, monkeypatch):
+        files = self._files(tmp_path)
+        cache = main.AnalysisCache(str(tmp_path / "cache" / "results.sqlite3"))
+        first = main.analyze_multiple_files(files, 300, 50, cache=cache)
+
+        def fail_analyze(*args, **kwargs):
+            raise AssertionError("cached file was re-analyzed")
+
+        monkeypatch.setattr(main, "analyze_single_file", fail_analyze)
+        second = main.analyze_multiple_files(files, 300, 50, cache=cache)
+        cache.close()
+
+        assert second == first
+
+    def test_changed_file_or_settings_reanalyzed(self, tmp_path: Path):
+        files = self._files(tmp_path)
+        cache = main.AnalysisCache(str(tmp_path / "results.sqlite3"))
+        main.analyze_multiple_files(files, 300, 50, cache=cache)
+
+        Path(files[0]["path"]).write_text("def a():\n    pass\n\ndef c():\n    pass", encoding="utf-8")
+        changed = main.analyze_multiple_files(files, 300, 50, cache=cache)
+        stricter = main.analyze_multiple_files(files, 300, 1, cache=cache)
+        cache.close()
+
+        assert changed["aggregate"]["total_functions"] == 3
+        assert stricter["aggregate"]["total_warnings"] == 3
+
+    def test_analyzer_change_drops_cache(self, tmp_path: Path, monkeypatch):
+        files = self._files(tmp_path)
+        db_path = str(tmp_path / "results.sqlite3")
+        cache = main.AnalysisCache(db_path)
+        main.analyze_multiple_files(files, 300, 50, cache=cache)
+        cache.close()
+
+        def count_results() -> int:
+            conn = sqlite3.connect(db_path)
+            try:
+                return conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            finally:
+                conn.close()
+
+        assert count_results() == 2
+        monkeypatch.setattr(main, "_analyzer_fingerprint", lambda: "other")
+        main.AnalysisCache(db_path).close()
+
+        assert count_results() == 0
+
+    def test_main_cache_flag(self, monkeypatch, capsys, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "one.py").write_text("def a():\n    pass", encoding="utf-8")
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps({"path": str(tmp_path / "src"), "cache": True})))
+
+        main.main()
+        result = json.loads(capsys.readouterr().out)
+
+        assert result["aggregate"]["total_functions"] == 1
+        assert (tmp_path / "xdg" / "code-stats" / "results.sqlite3").is_file()
+
 
 class TestMainEntryPoint:
     """Tests that exercise main() end-to-end via stdin/stdout."""
@@ -649,6 +848,15 @@ class TestMainEntryPoint:
         assert result["files_analyzed"] == 2
         assert result["aggregate"]["total_functions"] == 2
 
+    def test_stdlib_json_fallback(self, monkeypatch, capsys, tmp_path):
+        (tmp_path / "one.py").write_text("def a():\n    pass", encoding="utf-8")
+        with_orjson = self._run_main(monkeypatch, capsys, {"path": str(tmp_path)})
+
+        monkeypatch.setattr(main, "orjson", None)
+        without_orjson = self._run_main(monkeypatch, capsys, {"path": str(tmp_path)})
+
+        assert with_orjson == without_orjson
+
     def test_missing_input_returns_error(self, monkeypatch, capsys):
         result = self._run_main(monkeypatch, capsys, {})
         assert "error" in result
@@ -897,6 +1105,18 @@ class TestFileFiltering:
         assert "normal.js" in names
         assert "bundle.js" not in names
 
+    def test_small_file_not_sniffed(self, tmp_path, monkeypatch):
+        """Files too small to average > 500 chars/line are never opened."""
+        (tmp_path / "tiny.js").write_text("var a=1;" * 50, encoding="utf-8")
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("small file should not be sniffed")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+        files = main.collect_files_from_directory(str(tmp_path))
+
+        assert [f["original_name"] for f in files] == ["tiny.js"]
+
     def test_skip_dist_out_build(self, tmp_path):
         for dirname in ("dist", "out", "build"):
             d = tmp_path / dirname
@@ -943,6 +1163,26 @@ class TestFileFiltering:
         names = [f["original_name"] for f in files]
         assert names == sorted(names)
 
+    def test_nested_ordering_matches_sorted_rglob(self, tmp_path):
+        for rel in ("b.py", "a/z.py", "a.py", "a/b/c.py", "c/d.py"):
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1", encoding="utf-8")
+
+        files = main.collect_files_from_directory(str(tmp_path), max_files=3)
+
+        assert [f["original_name"] for f in files] == ["a/b/c.py", "a/z.py", "a.py"]
+
+    def test_scan_root_inside_skip_dir_name(self, tmp_path):
+        """Only directories below the scan root are matched against SKIP_DIRS."""
+        root = tmp_path / "build" / "project"
+        root.mkdir(parents=True)
+        (root / "app.py").write_text("x = 1", encoding="utf-8")
+
+        files = main.collect_files_from_directory(str(root))
+
+        assert [f["original_name"] for f in files] == ["app.py"]
+
 
 class TestBugfixRegressions:
     """Regression tests for specific bugs found in code review."""
@@ -0,0 +1,21 @@
+"""JSON decoding for audit tool output."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse JSON text or bytes, via orjson when installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    keep catching json.JSONDecodeError either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,5 +1,6 @@
 """FastAPI application for dependency scanner."""
 
+import asyncio
 import logging
 
 from fastapi import FastAPI, HTTPException
@@ -48,9 +49,12 @@ async def scan(request: ScanRequest) -> ScanResponse:
     - **severity_threshold**: Minimum severity to include (low/medium/high/critical)
     """
     try:
-        logger.info(f"Scanning repository: {request.repo_url}")
+        logger.info("Scanning repository: %s", request.repo_url)
 
-        response = scan_repository(
+        # Cloning and running the audit tools block for a long time, so run
+        # the scan in a worker thread to keep the event loop responsive.
+        response = await asyncio.to_thread(
+            scan_repository,
             repo_url=request.repo_url,
             package_managers=request.package_managers,
             severity_threshold=request.severity_threshold,
@@ -59,11 +63,11 @@ async def scan(request: ScanRequest) -> ScanResponse:
         return response
 
     except GitCommandError as e:
-        logger.error(f"Failed to clone repository: {e}")
+        logger.error("Failed to clone repository: %s", e)
         raise HTTPException(
             status_code=400,
             detail=f"Failed to clone repository: {request.repo_url}",
         )
     except Exception as e:
-        logger.error(f"Scan failed: {e}")
+        logger.error("Scan failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Scan failed: {str(e)}")
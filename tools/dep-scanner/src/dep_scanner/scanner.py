@@ -14,6 +14,9 @@ logger = logging.getLogger(__name__)
 # Severity levels in order from lowest to highest
 SEVERITY_ORDER = ["low", "medium", "high", "critical"]
 
+# Severity name -> position in SEVERITY_ORDER, for O(1) threshold checks
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SEVERITY_ORDER)}
+
 
 def scan_repository(
     repo_url: str | None = None,
@@ -86,7 +89,7 @@ def _run_scanners(
 
     # Run each scanner
     for manager in scanners_to_run:
-        logger.info(f"Running {manager} scanner...")
+        logger.info("Running %s scanner...", manager)
 
         if manager == "npm":
             findings = run_npm_audit(repo_path)
@@ -117,16 +120,17 @@ def _filter_by_severity(
         Filtered list of findings
     """
     threshold = threshold.lower()
-    if threshold not in SEVERITY_ORDER:
-        logger.warning(f"Invalid severity threshold '{threshold}', defaulting to 'low'")
-        threshold = "low"
-
-    threshold_index = SEVERITY_ORDER.index(threshold)
+    threshold_index = _SEVERITY_RANK.get(threshold)
+    if threshold_index is None:
+        logger.warning("Invalid severity threshold '%s', defaulting to 'low'", threshold)
+        threshold_index = 0
 
+    # Severities outside SEVERITY_ORDER (npm's "info", or "unknown") rank
+    # as low, so they are still reported at the default threshold.
     return [
         finding
         for finding in findings
-        if SEVERITY_ORDER.index(finding.severity.lower()) >= threshold_index
+        if _SEVERITY_RANK.get(finding.severity.lower(), 0) >= threshold_index
     ]
 
 
@@ -5,6 +5,7 @@ import logging
 import subprocess
 from pathlib import Path
 
+from ..json_utils import loads as json_loads
 from ..models import Finding
 
 logger = logging.getLogger(__name__)
@@ -65,14 +66,14 @@ def run_npm_audit(repo_path: Path) -> list[Finding]:
         if result.stdout:
             findings = parse_npm_audit_output(result.stdout)
         elif result.stderr and "ERR!" in result.stderr:
-            logger.warning(f"npm audit error: {result.stderr}")
+            logger.warning("npm audit error: %s", result.stderr)
 
     except subprocess.TimeoutExpired:
         logger.error("npm audit timed out")
     except FileNotFoundError:
         logger.warning("npm not found, skipping npm audit")
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse npm audit output: {e}")
+        logger.error("Failed to parse npm audit output: %s", e)
 
     return findings
 
@@ -103,7 +104,7 @@ def parse_npm_audit_output(output: str) -> list[Finding]:
     findings: list[Finding] = []
 
     try:
-        data = json.loads(output)
+        data = json_loads(output)
     except json.JSONDecodeError:
         logger.error("Failed to parse npm audit JSON output")
         return findings
@@ -178,7 +179,7 @@ def get_npm_package_count(repo_path: Path) -> int:
             timeout=60,
         )
         if result.stdout:
-            data = json.loads(result.stdout)
+            data = json_loads(result.stdout)
             # Count all dependencies recursively
             return count_dependencies(data.get("dependencies", {}))
     except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
@@ -2,13 +2,27 @@
 
 import json
 import logging
+import re
 import subprocess
 from pathlib import Path
 
+from ..json_utils import loads as json_loads
 from ..models import Finding
 
 logger = logging.getLogger(__name__)
 
+# Description keywords per severity, checked in order so the most severe
+# keyword wins. Matching is plain case-insensitive substring search.
+_SEVERITY_KEYWORDS = (
+    ("critical", ("remote code execution", "rce", "critical")),
+    ("high", ("arbitrary code", "sql injection", "command injection")),
+    ("medium", ("denial of service", "dos", "crash")),
+)
+_SEVERITY_PATTERNS = tuple(
+    (severity, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for severity, keywords in _SEVERITY_KEYWORDS
+)
+
 
 def detect_python_deps(repo_path: Path) -> bool:
     """Check if the repository has Python dependency files."""
@@ -72,14 +86,14 @@ def run_pip_audit(repo_path: Path) -> list[Finding]:
             if "No module named" in result.stderr or "not found" in result.stderr.lower():
                 logger.warning("pip-audit not installed, skipping Python dependency scan")
             else:
-                logger.warning(f"pip-audit error: {result.stderr}")
+                logger.warning("pip-audit error: %s", result.stderr)
 
     except subprocess.TimeoutExpired:
         logger.error("pip-audit timed out")
     except FileNotFoundError:
         logger.warning("pip-audit not found, skipping Python dependency scan")
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse pip-audit output: {e}")
+        logger.error("Failed to parse pip-audit output: %s", e)
 
     return findings
 
@@ -119,7 +133,7 @@ def parse_pip_audit_output(output: str) -> list[Finding]:
     findings: list[Finding] = []
 
     try:
-        data = json.loads(output)
+        data = json_loads(output)
     except json.JSONDecodeError:
         logger.error("Failed to parse pip-audit JSON output")
         return findings
@@ -192,17 +206,11 @@ def determine_severity(vuln: dict) -> str:
     if "severity" in vuln:
         return vuln["severity"].lower()
 
-    # PYSEC advisories often have severity
-    vuln_id = vuln.get("id", "")
-    description = vuln.get("description", "").lower()
-
     # Try to infer from description keywords
-    if any(word in description for word in ["remote code execution", "rce", "critical"]):
-        return "critical"
-    elif any(word in description for word in ["arbitrary code", "sql injection", "command injection"]):
-        return "high"
-    elif any(word in description for word in ["denial of service", "dos", "crash"]):
-        return "medium"
+    description = vuln.get("description", "")
+    for severity, pattern in _SEVERITY_PATTERNS:
+        if pattern.search(description):
+            return severity
 
     # Default to medium if unknown
     return "medium"
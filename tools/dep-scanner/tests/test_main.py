@@ -5,10 +5,12 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 import tempfile
 
+from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
 
 from dep_scanner.main import app
 from dep_scanner.models import Finding, ScanResponse, ScanSummary
+from dep_scanner.scanner import _filter_by_severity
 from dep_scanner.scanners.npm import parse_npm_audit_output
 from dep_scanner.scanners.pip import parse_pip_audit_output, determine_severity
 
@@ -19,6 +21,12 @@ def test_client():
     return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
 
+@pytest.fixture
+def sync_client():
+    """Create a synchronous test client, for tests that mock out the async work."""
+    return TestClient(app)
+
+
 class TestHealthEndpoint:
     """Test /health endpoint."""
 
@@ -35,8 +43,7 @@ class TestHealthEndpoint:
 class TestScanEndpoint:
     """Test /scan endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_scan_with_mock_git_clone(self, test_client):
+    def test_scan_with_mock_git_clone(self, sync_client):
         """Test /scan endpoint with mocked git clone."""
         mock_response = ScanResponse(
             scan_id="test-uuid",
@@ -62,22 +69,20 @@ class TestScanEndpoint:
         )
 
         with patch("dep_scanner.main.scan_repository", return_value=mock_response):
-            async with test_client as client:
-                response = await client.post(
-                    "/scan",
-                    json={"repo_url": "https://github.com/example/repo.git"},
-                )
+            response = sync_client.post(
+                "/scan",
+                json={"repo_url": "https://github.com/example/repo.git"},
+            )
 
-                assert response.status_code == 200
-                data = response.json()
-                assert data["scan_id"] == "test-uuid"
-                assert data["detected_managers"] == ["npm"]
-                assert len(data["findings"]) == 1
-                assert data["findings"][0]["package"] == "lodash"
-                assert data["summary"]["high"] == 1
-
-    @pytest.mark.asyncio
-    async def test_scan_with_severity_threshold(self, test_client):
+            assert response.status_code == 200
+            data = response.json()
+            assert data["scan_id"] == "test-uuid"
+            assert data["detected_managers"] == ["npm"]
+            assert len(data["findings"]) == 1
+            assert data["findings"][0]["package"] == "lodash"
+            assert data["summary"]["high"] == 1
+
+    def test_scan_with_severity_threshold(self, sync_client):
         """Test /scan endpoint respects severity threshold."""
         mock_response = ScanResponse(
             scan_id="test-uuid",
@@ -97,22 +102,20 @@ class TestScanEndpoint:
         )
 
         with patch("dep_scanner.main.scan_repository", return_value=mock_response):
-            async with test_client as client:
-                response = await client.post(
-                    "/scan",
-                    json={
-                        "repo_url": "https://github.com/example/repo.git",
-                        "severity_threshold": "high",
-                    },
-                )
+            response = sync_client.post(
+                "/scan",
+                json={
+                    "repo_url": "https://github.com/example/repo.git",
+                    "severity_threshold": "high",
+                },
+            )
 
-                assert response.status_code == 200
-                data = response.json()
-                assert len(data["findings"]) == 1
-                assert data["findings"][0]["severity"] == "high"
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data["findings"]) == 1
+            assert data["findings"][0]["severity"] == "high"
 
-    @pytest.mark.asyncio
-    async def test_scan_with_invalid_repo_url(self, test_client):
+    def test_scan_with_invalid_repo_url(self, sync_client):
         """Test /scan endpoint with invalid repository URL."""
         from git.exc import GitCommandError
 
@@ -120,17 +123,15 @@ class TestScanEndpoint:
             "dep_scanner.main.scan_repository",
             side_effect=GitCommandError("git clone", 128),
         ):
-            async with test_client as client:
-                response = await client.post(
-                    "/scan",
-                    json={"repo_url": "https://github.com/invalid/repo.git"},
-                )
+            response = sync_client.post(
+                "/scan",
+                json={"repo_url": "https://github.com/invalid/repo.git"},
+            )
 
-                assert response.status_code == 400
-                assert "Failed to clone repository" in response.json()["detail"]
+            assert response.status_code == 400
+            assert "Failed to clone repository" in response.json()["detail"]
 
-    @pytest.mark.asyncio
-    async def test_scan_with_no_vulnerabilities(self, test_client):
+    def test_scan_with_no_vulnerabilities(self, sync_client):
         """Test /scan endpoint when no vulnerabilities are found."""
         mock_response = ScanResponse(
             scan_id="test-uuid",
@@ -142,273 +143,326 @@ class TestScanEndpoint:
         )
 
         with patch("dep_scanner.main.scan_repository", return_value=mock_response):
-            async with test_client as client:
-                response = await client.post(
-                    "/scan",
-                    json={"repo_url": "https://github.com/example/repo.git"},
-                )
-
-                assert response.status_code == 200
-                data = response.json()
-                assert len(data["findings"]) == 0
-                assert data["detected_managers"] == ["npm", "pip"]
+            response = sync_client.post(
+                "/scan",
+                json={"repo_url": "https://github.com/example/repo.git"},
+            )
 
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data["findings"]) == 0
+            assert data["detected_managers"] == ["npm", "pip"]
 
-class TestNpmAuditParsing:
-    """Test npm audit output parsing."""
 
-    def test_parse_npm_audit_with_vulnerabilities(self):
-        """Test parsing npm audit output with vulnerabilities."""
-        npm_audit_output = """{
-            "vulnerabilities": {
-                "lodash": {
+NPM_LODASH_HIGH = """{
+    "vulnerabilities": {
+        "lodash": {
+            "name": "lodash",
+            "severity": "high",
+            "via": [
+                {
+                    "source": 1065,
                     "name": "lodash",
+                    "dependency": "lodash",
+                    "title": "Command Injection",
+                    "url": "https://npmjs.com/advisories/1065",
                     "severity": "high",
-                    "via": [
-                        {
-                            "source": 1065,
-                            "name": "lodash",
-                            "dependency": "lodash",
-                            "title": "Command Injection",
-                            "url": "https://npmjs.com/advisories/1065",
-                            "severity": "high",
-                            "cve": "CVE-2021-23337",
-                            "range": "<4.17.21"
-                        }
-                    ],
-                    "effects": [],
-                    "range": "<4.17.21",
-                    "nodes": ["node_modules/lodash"],
-                    "fixAvailable": {
-                        "name": "lodash",
-                        "version": "4.17.21"
-                    }
-                }
-            },
-            "metadata": {
-                "vulnerabilities": {
-                    "info": 0, "low": 0, "moderate": 0, "high": 1, "critical": 0, "total": 1
+                    "cve": "CVE-2021-23337",
+                    "range": "<4.17.21"
                 }
+            ],
+            "effects": [],
+            "range": "<4.17.21",
+            "nodes": ["node_modules/lodash"],
+            "fixAvailable": {
+                "name": "lodash",
+                "version": "4.17.21"
             }
-        }"""
-
-        findings = parse_npm_audit_output(npm_audit_output)
-
-        assert len(findings) == 1
-        assert findings[0].package == "lodash"
-        assert findings[0].severity == "high"
-        assert findings[0].cve == "CVE-2021-23337"
-        assert findings[0].title == "Command Injection"
-        assert findings[0].fixed_in == "4.17.21"
-        assert "npm update" in findings[0].recommendation
-
-    def test_parse_npm_audit_with_moderate_severity(self):
-        """Test that 'moderate' is mapped to 'medium'."""
-        npm_audit_output = """{
-            "vulnerabilities": {
-                "minimist": {
+        }
+    },
+    "metadata": {
+        "vulnerabilities": {
+            "info": 0, "low": 0, "moderate": 0, "high": 1, "critical": 0, "total": 1
+        }
+    }
+}"""
+
+NPM_MINIMIST_MODERATE = """{
+    "vulnerabilities": {
+        "minimist": {
+            "name": "minimist",
+            "severity": "moderate",
+            "via": [
+                {
+                    "source": 1179,
                     "name": "minimist",
+                    "title": "Prototype Pollution",
                     "severity": "moderate",
-                    "via": [
-                        {
-                            "source": 1179,
-                            "name": "minimist",
-                            "title": "Prototype Pollution",
-                            "severity": "moderate",
-                            "cve": "CVE-2020-7598",
-                            "range": "<0.2.1"
-                        }
-                    ],
-                    "fixAvailable": true
-                }
-            }
-        }"""
-
-        findings = parse_npm_audit_output(npm_audit_output)
-
-        assert len(findings) == 1
-        assert findings[0].severity == "medium"
-
-    def test_parse_npm_audit_no_vulnerabilities(self):
-        """Test parsing npm audit output with no vulnerabilities."""
-        npm_audit_output = """{
-            "vulnerabilities": {},
-            "metadata": {
-                "vulnerabilities": {
-                    "info": 0, "low": 0, "moderate": 0, "high": 0, "critical": 0, "total": 0
+                    "cve": "CVE-2020-7598",
+                    "range": "<0.2.1"
                 }
-            }
-        }"""
-
-        findings = parse_npm_audit_output(npm_audit_output)
-
-        assert len(findings) == 0
-
-    def test_parse_npm_audit_transitive_dependency(self):
-        """Test parsing npm audit output with transitive dependency (string via)."""
-        npm_audit_output = """{
-            "vulnerabilities": {
-                "ansi-regex": {
-                    "name": "ansi-regex",
-                    "severity": "high",
-                    "via": ["string-width"],
-                    "effects": [],
-                    "fixAvailable": true
-                },
-                "string-width": {
+            ],
+            "fixAvailable": true
+        }
+    }
+}"""
+
+NPM_EMPTY = """{
+    "vulnerabilities": {},
+    "metadata": {
+        "vulnerabilities": {
+            "info": 0, "low": 0, "moderate": 0, "high": 0, "critical": 0, "total": 0
+        }
+    }
+}"""
+
+# ansi-regex is only vulnerable through string-width (string "via" entry),
+# so only string-width should be reported.
+NPM_TRANSITIVE = """{
+    "vulnerabilities": {
+        "ansi-regex": {
+            "name": "ansi-regex",
+            "severity": "high",
+            "via": ["string-width"],
+            "effects": [],
+            "fixAvailable": true
+        },
+        "string-width": {
+            "name": "string-width",
+            "severity": "high",
+            "via": [
+                {
+                    "source": 1234,
                     "name": "string-width",
+                    "title": "ReDoS",
                     "severity": "high",
-                    "via": [
-                        {
-                            "source": 1234,
-                            "name": "string-width",
-                            "title": "ReDoS",
-                            "severity": "high",
-                            "cve": "CVE-2021-3807",
-                            "range": "<4.2.3"
-                        }
-                    ],
-                    "fixAvailable": true
+                    "cve": "CVE-2021-3807",
+                    "range": "<4.2.3"
                 }
+            ],
+            "fixAvailable": true
+        }
+    }
+}"""
+
+NPM_CASES = [
+    pytest.param(
+        NPM_LODASH_HIGH,
+        [
+            {
+                "package": "lodash",
+                "severity": "high",
+                "cve": "CVE-2021-23337",
+                "title": "Command Injection",
+                "fixed_in": "4.17.21",
             }
-        }"""
-
-        findings = parse_npm_audit_output(npm_audit_output)
-
-        # Should only find string-width (the direct vulnerability), not ansi-regex
-        assert len(findings) == 1
-        assert findings[0].package == "string-width"
-
-    def test_parse_npm_audit_invalid_json(self):
-        """Test parsing invalid JSON returns empty list."""
-        findings = parse_npm_audit_output("not valid json")
-
-        assert findings == []
-
-
-class TestPipAuditParsing:
-    """Test pip-audit output parsing."""
-
-    def test_parse_pip_audit_with_vulnerabilities(self):
-        """Test parsing pip-audit output with vulnerabilities."""
-        pip_audit_output = """[
+        ],
+        "npm update",
+        id="with-vulnerabilities",
+    ),
+    pytest.param(
+        NPM_MINIMIST_MODERATE,
+        [{"package": "minimist", "severity": "medium"}],
+        None,
+        id="moderate-to-medium",
+    ),
+    pytest.param(NPM_EMPTY, [], None, id="no-vulnerabilities"),
+    pytest.param(
+        NPM_TRANSITIVE,
+        [{"package": "string-width"}],
+        None,
+        id="transitive-dependency",
+    ),
+    pytest.param("not valid json", [], None, id="invalid-json"),
+]
+
+PIP_REQUESTS = """[
+    {
+        "name": "requests",
+        "version": "2.25.0",
+        "vulns": [
             {
-                "name": "requests",
-                "version": "2.25.0",
-                "vulns": [
-                    {
-                        "id": "GHSA-j8r2-6x86-q33q",
-                        "fix_versions": ["2.31.0"],
-                        "aliases": ["CVE-2023-32681"],
-                        "description": "Unintended leak of Proxy-Authorization header in requests"
-                    }
-                ]
+                "id": "GHSA-j8r2-6x86-q33q",
+                "fix_versions": ["2.31.0"],
+                "aliases": ["CVE-2023-32681"],
+                "description": "Unintended leak of Proxy-Authorization header in requests"
             }
-        ]"""
-
-        findings = parse_pip_audit_output(pip_audit_output)
-
-        assert len(findings) == 1
-        assert findings[0].package == "requests"
-        assert findings[0].version == "2.25.0"
-        assert findings[0].cve == "CVE-2023-32681"
-        assert findings[0].fixed_in == "2.31.0"
-        assert "pip install --upgrade" in findings[0].recommendation
-
-    def test_parse_pip_audit_dict_format(self):
-        """Test parsing pip-audit output in dict format."""
-        pip_audit_output = """{
-            "dependencies": [
+        ]
+    }
+]"""
+
+PIP_DICT_FORMAT = """{
+    "dependencies": [
+        {
+            "name": "urllib3",
+            "version": "1.26.0",
+            "vulns": [
                 {
-                    "name": "urllib3",
-                    "version": "1.26.0",
-                    "vulns": [
-                        {
-                            "id": "PYSEC-2021-108",
-                            "fix_versions": ["1.26.5"],
-                            "aliases": ["CVE-2021-33503"],
-                            "description": "urllib3 can cause Denial of Service when parsing URLs"
-                        }
-                    ]
+                    "id": "PYSEC-2021-108",
+                    "fix_versions": ["1.26.5"],
+                    "aliases": ["CVE-2021-33503"],
+                    "description": "urllib3 can cause Denial of Service when parsing URLs"
                 }
-            ],
-            "fixes": []
-        }"""
-
-        findings = parse_pip_audit_output(pip_audit_output)
-
-        assert len(findings) == 1
-        assert findings[0].package == "urllib3"
-        assert findings[0].cve == "CVE-2021-33503"
-
-    def test_parse_pip_audit_no_vulnerabilities(self):
-        """Test parsing pip-audit output with no vulnerabilities."""
-        pip_audit_output = "[]"
-
-        findings = parse_pip_audit_output(pip_audit_output)
-
-        assert len(findings) == 0
-
-    def test_parse_pip_audit_no_fix_available(self):
-        """Test parsing when no fix is available."""
-        pip_audit_output = """[
+            ]
+        }
+    ],
+    "fixes": []
+}"""
+
+PIP_NO_FIX = """[
+    {
+        "name": "example-pkg",
+        "version": "1.0.0",
+        "vulns": [
             {
-                "name": "example-pkg",
-                "version": "1.0.0",
-                "vulns": [
-                    {
-                        "id": "GHSA-xxxx-yyyy-zzzz",
-                        "fix_versions": [],
-                        "aliases": [],
-                        "description": "Some vulnerability"
-                    }
-                ]
+                "id": "GHSA-xxxx-yyyy-zzzz",
+                "fix_versions": [],
+                "aliases": [],
+                "description": "Some vulnerability"
             }
-        ]"""
-
-        findings = parse_pip_audit_output(pip_audit_output)
+        ]
+    }
+]"""
+
+PIP_CASES = [
+    pytest.param(
+        PIP_REQUESTS,
+        [
+            {
+                "package": "requests",
+                "version": "2.25.0",
+                "cve": "CVE-2023-32681",
+                "fixed_in": "2.31.0",
+            }
+        ],
+        "pip install --upgrade",
+        id="with-vulnerabilities",
+    ),
+    pytest.param(
+        PIP_DICT_FORMAT,
+        [{"package": "urllib3", "cve": "CVE-2021-33503"}],
+        None,
+        id="dict-format",
+    ),
+    pytest.param("[]", [], None, id="no-vulnerabilities"),
+    pytest.param(
+        PIP_NO_FIX,
+        [{"fixed_in": "no fix available"}],
+        "consider replacing",
+        id="no-fix-available",
+    ),
+    pytest.param("not valid json", [], None, id="invalid-json"),
+]
+
+SEVERITY_CASES = [
+    pytest.param(
+        {"description": "Remote code execution vulnerability"},
+        "critical",
+        id="critical-rce-phrase",
+    ),
+    pytest.param(
+        {"description": "RCE in package"}, "critical", id="critical-rce-acronym"
+    ),
+    pytest.param(
+        {"description": "SQL injection vulnerability"}, "high", id="high-sql-injection"
+    ),
+    pytest.param(
+        {"description": "Command injection in parser"},
+        "high",
+        id="high-command-injection",
+    ),
+    pytest.param(
+        {"description": "SQL injection leading to remote code execution"},
+        "critical",
+        id="most-severe-keyword-wins",
+    ),
+    pytest.param(
+        {"description": "Denial of service when parsing large files"},
+        "medium",
+        id="medium-dos",
+    ),
+    pytest.param(
+        {"severity": "LOW", "description": "Some issue"}, "low", id="explicit"
+    ),
+    pytest.param({"description": "Some random issue"}, "medium", id="default"),
+]
+
+
+def assert_findings(findings, expected, recommendation_hint):
+    """Check findings against per-finding field expectations."""
+    assert len(findings) == len(expected)
+    for finding, fields in zip(findings, expected):
+        for name, value in fields.items():
+            assert getattr(finding, name) == value, name
+        if recommendation_hint is not None:
+            assert recommendation_hint in finding.recommendation.lower()
 
-        assert len(findings) == 1
-        assert findings[0].fixed_in == "no fix available"
-        assert "consider replacing" in findings[0].recommendation.lower()
 
-    def test_parse_pip_audit_invalid_json(self):
-        """Test parsing invalid JSON returns empty list."""
-        findings = parse_pip_audit_output("not valid json")
+class TestNpmAuditParsing:
+    """Test npm audit output parsing."""
 
-        assert findings == []
+    @pytest.mark.parametrize("output,expected,recommendation_hint", NPM_CASES)
+    def test_parse_npm_audit_output(self, output, expected, recommendation_hint):
+        """Test parsing npm audit output into findings."""
+        findings = parse_npm_audit_output(output)
 
+        assert_findings(findings, expected, recommendation_hint)
 
-class TestDetermineSeverity:
-    """Test severity determination for pip-audit findings."""
 
-    def test_determine_severity_critical(self):
-        """Test critical severity detection."""
-        vuln = {"description": "Remote code execution vulnerability"}
-        assert determine_severity(vuln) == "critical"
+class TestPipAuditParsing:
+    """Test pip-audit output parsing."""
 
-        vuln = {"description": "RCE in package"}
-        assert determine_severity(vuln) == "critical"
+    @pytest.mark.parametrize("output,expected,recommendation_hint", PIP_CASES)
+    def test_parse_pip_audit_output(self, output, expected, recommendation_hint):
+        """Test parsing pip-audit output into findings."""
+        findings = parse_pip_audit_output(output)
 
-    def test_determine_severity_high(self):
-        """Test high severity detection."""
-        vuln = {"description": "SQL injection vulnerability"}
-        assert determine_severity(vuln) == "high"
+        assert_findings(findings, expected, recommendation_hint)
 
-        vuln = {"description": "Command injection in parser"}
-        assert determine_severity(vuln) == "high"
 
-    def test_determine_severity_medium(self):
-        """Test medium severity detection."""
-        vuln = {"description": "Denial of service when parsing large files"}
-        assert determine_severity(vuln) == "medium"
+class TestDetermineSeverity:
+    """Test severity determination for pip-audit findings."""
 
-    def test_determine_severity_explicit(self):
-        """Test when severity is explicitly provided."""
-        vuln = {"severity": "LOW", "description": "Some issue"}
-        assert determine_severity(vuln) == "low"
+    @pytest.mark.parametrize("vuln,expected", SEVERITY_CASES)
+    def test_determine_severity(self, vuln, expected):
+        """Test severity from explicit field, description keywords or default."""
+        assert determine_severity(vuln) == expected
+
+
+class TestFilterBySeverity:
+    """Test severity threshold filtering."""
+
+    @staticmethod
+    def _finding(severity):
+        return Finding(
+            package="pkg",
+            version="1.0.0",
+            severity=severity,
+            cve="CVE-0000-0000",
+            title="Issue",
+            fixed_in="1.0.1",
+            recommendation="Upgrade",
+        )
 
-    def test_determine_severity_default(self):
-        """Test default severity when nothing matches."""
-        vuln = {"description": "Some random issue"}
-        assert determine_severity(vuln) == "medium"
+    @pytest.mark.parametrize(
+        "threshold,expected",
+        [
+            pytest.param(
+                "low", ["low", "medium", "High", "critical", "unknown"], id="low"
+            ),
+            pytest.param("HIGH", ["High", "critical"], id="high"),
+            pytest.param(
+                "bogus", ["low", "medium", "High", "critical", "unknown"], id="invalid"
+            ),
+        ],
+    )
+    def test_filter_by_severity(self, threshold, expected):
+        """Test threshold filtering, including severities outside the known order."""
+        findings = [
+            self._finding(severity)
+            for severity in ["low", "medium", "High", "critical", "unknown"]
+        ]
+
+        filtered = _filter_by_severity(findings, threshold)
+
+        assert [f.severity for f in filtered] == expected
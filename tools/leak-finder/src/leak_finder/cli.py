@@ -5,7 +5,7 @@ import json
 import sys
 from pathlib import Path
 
-from .scanner import scan_directory
+from .scanner import iter_scan_directory, scan_directory
 from .git_utils import scan_git_history
 from .models import Finding
 
@@ -46,6 +46,14 @@ def format_findings_table(findings: list[Finding], title: str = "Findings") -> s
     return "\n".join(lines)
 
 
+def mark_rotated(finding: Finding, rotated_keys: list[str]) -> None:
+    """Downgrade a current-file finding whose preview matches a rotated key."""
+    if any(finding.preview.startswith(rk[:4]) for rk in rotated_keys):
+        finding.rotated = True
+        finding.severity = "info"
+        finding.recommendation = "Key marked as rotated."
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -57,6 +65,8 @@ Examples:
   python -m leak_finder.cli ./my-project --deep
   python -m leak_finder.cli ./my-project --rotated AKIA1234,sk_live_abc
   python -m leak_finder.cli ./my-project --json
+  python -m leak_finder.cli ./my-project --jsonl
+  python -m leak_finder.cli ./my-project --cache .leak-finder-cache
         """,
     )
     parser.add_argument(
@@ -81,12 +91,24 @@ Examples:
         default="",
         help="Comma-separated list of directory names to skip during scanning",
     )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        help="SQLite file for reusing results of files unchanged since the last scan",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
         dest="json_output",
         help="Output results as JSON",
     )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        dest="jsonl_output",
+        help="Stream findings as JSON lines while scanning",
+    )
 
     args = parser.parse_args()
 
@@ -105,16 +127,16 @@ Examples:
     # Parse exclude dirs
     extra_skip_dirs = {d.strip() for d in args.exclude.split(",") if d.strip()} or None
 
+    if args.jsonl_output:
+        sys.exit(stream_jsonl(scan_path, rotated_keys, extra_skip_dirs, args.deep, args.cache))
+
     # Scan current files
-    findings = scan_directory(scan_path, extra_skip_dirs=extra_skip_dirs)
+    findings = scan_directory(scan_path, extra_skip_dirs=extra_skip_dirs, cache_path=args.cache)
 
     # Apply rotated keys to current findings
     if rotated_keys:
         for finding in findings:
-            if any(finding.preview.startswith(rk[:4]) for rk in rotated_keys):
-                finding.rotated = True
-                finding.severity = "info"
-                finding.recommendation = "Key marked as rotated."
+            mark_rotated(finding, rotated_keys)
 
     # Deep scan if requested
     history_findings = []
@@ -152,5 +174,41 @@ Examples:
     sys.exit(1 if has_critical else 0)
 
 
+def stream_jsonl(
+    scan_path: Path,
+    rotated_keys: list[str],
+    extra_skip_dirs: set[str] | None,
+    deep: bool,
+    cache_path: str | None = None,
+) -> int:
+    """
+    Print one JSON object per finding as soon as it is found.
+
+    Current-file findings come first, then git history ones with --deep.
+    Nothing is accumulated, so memory stays flat on very large trees.
+
+    Returns:
+        Exit code: 1 if any finding is critical, else 0
+    """
+    has_critical = False
+    for finding in iter_scan_directory(
+        scan_path, extra_skip_dirs=extra_skip_dirs, cache_path=cache_path
+    ):
+        if rotated_keys:
+            mark_rotated(finding, rotated_keys)
+        has_critical = has_critical or finding.severity == "critical"
+        print(finding.model_dump_json(), flush=True)
+
+    if deep:
+        if (scan_path / ".git").exists():
+            for finding in scan_git_history(scan_path, rotated_keys):
+                has_critical = has_critical or finding.severity == "critical"
+                print(finding.model_dump_json(), flush=True)
+        else:
+            print("Warning: --deep specified but no .git directory found", file=sys.stderr)
+
+    return 1 if has_critical else 0
+
+
 if __name__ == "__main__":
     main()
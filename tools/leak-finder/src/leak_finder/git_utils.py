@@ -7,8 +7,8 @@ from pathlib import Path
 from git import Repo
 
 from .models import Finding
-from .patterns import SECRET_PATTERNS
-from .scanner import redact_secret, get_recommendation
+from .patterns import COMBINED_PATTERN, SECRET_PATTERNS
+from .scanner import redact_secret
 
 
 def clone_repo(repo_url: str, branch: str | None = None) -> Path:
@@ -100,16 +100,13 @@ def scan_git_history(repo_path: Path, rotated_keys: list[str] | None = None) ->
 
                     for line_num, line in enumerate(diff_text.split("\n"), start=1):
                         # Only check added lines (starting with +)
-                        if not line.startswith("+"):
+                        if not line.startswith("+") or not COMBINED_PATTERN.search(line):
                             continue
 
                         for pattern_name, pattern_info in SECRET_PATTERNS.items():
                             matches = pattern_info["regex"].finditer(line)
                             for match in matches:
-                                try:
-                                    secret_value = match.group(1) if match.lastindex else match.group(0)
-                                except IndexError:
-                                    secret_value = match.group(0)
+                                secret_value = match.group(pattern_info["value_group"])
 
                                 # Check if this key has been rotated
                                 is_rotated = any(
@@ -124,7 +121,7 @@ def scan_git_history(repo_path: Path, rotated_keys: list[str] | None = None) ->
                                     preview=redact_secret(secret_value),
                                     in_history=True,
                                     rotated=is_rotated,
-                                    recommendation=get_recommendation(pattern_name, pattern_info["severity"]) if not is_rotated else "Key marked as rotated.",
+                                    recommendation=pattern_info["recommendation"] if not is_rotated else "Key marked as rotated.",
                                 )
                                 findings.append(finding)
         except Exception:
@@ -1,23 +1,29 @@
 """LLM-based analysis to validate findings and reduce false positives."""
 
+import asyncio
+import functools
 import json
 import os
+import re
+import weakref
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from .models import Finding
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
 
 # Load the analysis prompt
 PROMPTS_DIR = Path(__file__).parent / "prompts"
+PROMPT_FILE = PROMPTS_DIR / "analysis.txt"
 
-
-def get_analysis_prompt() -> str:
-    """Load the analysis prompt from file."""
-    prompt_file = PROMPTS_DIR / "analysis.txt"
-    if prompt_file.exists():
-        return prompt_file.read_text()
-    # Fallback prompt if file doesn't exist
-    return """You are a security expert analyzing potential secret/credential findings.
+# Fallback prompt if the prompt file doesn't exist
+_DEFAULT_ANALYSIS_PROMPT = """You are a security expert analyzing potential secret/credential findings.
 For each finding, determine if it's a true positive or false positive.
 
 Respond with a JSON array of objects, each with:
@@ -35,6 +41,83 @@ Common false positives:
 """
 
 
+def _load_analysis_prompt() -> str:
+    """Load the analysis prompt from file, falling back to the built-in one."""
+    try:
+        return PROMPT_FILE.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        # Runs at import, so an unreadable file mustn't break the CLI and API
+        return _DEFAULT_ANALYSIS_PROMPT
+
+
+# Read once at import instead of on every validate_findings() call.
+_ANALYSIS_PROMPT = _load_analysis_prompt()
+
+
+def get_analysis_prompt() -> str:
+    """Return the analysis prompt (loaded once at import)."""
+    return _ANALYSIS_PROMPT
+
+
+# Upper bound on in-flight LLM requests per event loop.
+MAX_CONCURRENT_LLM_CALLS = 8
+
+# Provider clients and call limits are tied to the event loop they were
+# created on (their HTTP connection pools are loop-bound), so both are kept
+# per loop and dropped with it.
+_loop_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_loop_call_limits: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+# A response wrapped in a markdown code fence (```json ... ```); the closing
+# fence is optional so truncated responses are still unwrapped.
+_CODE_FENCE_RE = re.compile(r"\A\s*```(?:json)?\s*(.*?)\s*(?:```\s*)?\Z", re.DOTALL)
+
+
+def _loads(data: str) -> Any:
+    """Parse a JSON response body, via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_validations(content: str) -> list[dict] | None:
+    """
+    Parse an LLM response into the list of per-finding validations.
+
+    Strips a surrounding markdown code fence before parsing, and accepts
+    either a bare JSON array or an object wrapping it under "findings" or
+    "results".
+    """
+    match = _CODE_FENCE_RE.match(content)
+    result = _loads(match.group(1) if match else content)
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict) and "findings" in result:
+        return result["findings"]
+    if isinstance(result, dict) and "results" in result:
+        return result["results"]
+    return None
+
+
+def _get_client(provider: str, api_key: str, factory: Callable[[], Any]) -> Any:
+    """Return a cached provider client for the running loop, creating it once."""
+    clients = _loop_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get((provider, api_key))
+    if client is None:
+        client = clients[(provider, api_key)] = factory()
+    return client
+
+
+def _call_limit() -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent LLM calls on the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _loop_call_limits.get(loop)
+    if semaphore is None:
+        semaphore = _loop_call_limits[loop] = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+    return semaphore
+
+
 def _detect_provider() -> tuple[str | None, str | None]:
     """
     Detect which LLM provider is available based on environment variables.
@@ -56,7 +139,7 @@ async def _validate_with_openai(full_prompt: str, api_key: str) -> list[dict] |
     """Validate findings using OpenAI API."""
     from openai import AsyncOpenAI
 
-    client = AsyncOpenAI(api_key=api_key)
+    client = _get_client("openai", api_key, lambda: AsyncOpenAI(api_key=api_key))
 
     response = await client.chat.completions.create(
         model="gpt-4o-mini",
@@ -72,22 +155,14 @@ async def _validate_with_openai(full_prompt: str, api_key: str) -> list[dict] |
     if not content:
         return None
 
-    result = json.loads(content)
-    # Handle both direct array and wrapped object responses
-    if isinstance(result, list):
-        return result
-    if isinstance(result, dict) and "findings" in result:
-        return result["findings"]
-    if isinstance(result, dict) and "results" in result:
-        return result["results"]
-    return None
+    return _parse_validations(content)
 
 
 async def _validate_with_anthropic(full_prompt: str, api_key: str) -> list[dict] | None:
     """Validate findings using Anthropic API."""
     from anthropic import AsyncAnthropic
 
-    client = AsyncAnthropic(api_key=api_key)
+    client = _get_client("anthropic", api_key, lambda: AsyncAnthropic(api_key=api_key))
 
     response = await client.messages.create(
         model="claude-sonnet-4-20250514",
@@ -103,53 +178,37 @@ async def _validate_with_anthropic(full_prompt: str, api_key: str) -> list[dict]
         return None
 
     # Anthropic may wrap JSON in markdown code blocks
-    content = content.strip()
-    if content.startswith("```json"):
-        content = content[7:]
-    if content.startswith("```"):
-        content = content[3:]
-    if content.endswith("```"):
-        content = content[:-3]
-    content = content.strip()
-
-    result = json.loads(content)
-    if isinstance(result, list):
-        return result
-    if isinstance(result, dict) and "findings" in result:
-        return result["findings"]
-    if isinstance(result, dict) and "results" in result:
-        return result["results"]
-    return None
+    return _parse_validations(content)
+
+
+@functools.cache
+def _gemini_generation_config():
+    """Build the Gemini generation config once; the SDK is imported lazily."""
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        temperature=0.1,
+    )
 
 
 async def _validate_with_gemini(full_prompt: str, api_key: str) -> list[dict] | None:
     """Validate findings using Google Gemini API."""
     from google import genai
-    from google.genai import types
 
-    client = genai.Client(api_key=api_key)
+    client = _get_client("gemini", api_key, lambda: genai.Client(api_key=api_key))
 
     response = await client.aio.models.generate_content(
         model="gemini-2.5-flash",
         contents=full_prompt,
-        config=types.GenerateContentConfig(
-            response_mime_type="application/json",
-            temperature=0.1,
-        ),
+        config=_gemini_generation_config(),
     )
 
     content = response.text
     if not content:
         return None
 
-    result = json.loads(content)
-    if isinstance(result, list):
-        return result
-    if isinstance(result, dict) and "findings" in result:
-        return result["findings"]
-    if isinstance(result, dict) and "results" in result:
-        return result["results"]
-    return None
+    return _parse_validations(content)
 
 
 async def validate_findings(findings: list[Finding]) -> list[Finding]:
@@ -183,26 +242,33 @@ async def validate_findings(findings: list[Finding]) -> list[Finding]:
         full_prompt = f"{prompt}\n\nFindings to analyze:\n{findings_text}"
 
         # Call the appropriate provider
-        if provider == "openai":
-            validations = await _validate_with_openai(full_prompt, api_key)
-        elif provider == "anthropic":
-            validations = await _validate_with_anthropic(full_prompt, api_key)
-        elif provider == "gemini":
-            validations = await _validate_with_gemini(full_prompt, api_key)
-        else:
-            return findings
+        async with _call_limit():
+            if provider == "openai":
+                validations = await _validate_with_openai(full_prompt, api_key)
+            elif provider == "anthropic":
+                validations = await _validate_with_anthropic(full_prompt, api_key)
+            elif provider == "gemini":
+                validations = await _validate_with_gemini(full_prompt, api_key)
+            else:
+                return findings
 
         if not validations:
             return findings
 
         # Filter findings based on LLM validation
         validated_findings = []
+        finding_count = len(findings)
+        kept: set[int] = set()
         for validation in validations:
             idx = validation.get("index", -1)
+            # The LLM may repeat an index; keep (and annotate) each finding once
+            if not 0 <= idx < finding_count or idx in kept:
+                continue
+
             is_secret = validation.get("is_secret", True)
             confidence = validation.get("confidence", 1.0)
-
-            if 0 <= idx < len(findings) and is_secret and confidence >= 0.5:
+            if is_secret and confidence >= 0.5:
+                kept.add(idx)
                 finding = findings[idx]
                 # Add confidence to recommendation
                 finding.recommendation = f"[Confidence: {confidence:.0%}] {finding.recommendation}"
@@ -215,15 +281,38 @@ async def validate_findings(findings: list[Finding]) -> list[Finding]:
         return findings
 
 
+async def _close_loop_clients() -> None:
+    """Close the provider clients cached for the running loop."""
+    clients = _loop_clients.pop(asyncio.get_running_loop(), {})
+    for (provider, _), client in clients.items():
+        try:
+            if provider == "gemini":
+                await client.aio.aclose()
+            else:
+                await client.close()
+        except Exception:
+            pass  # Closing only releases connections; results are unaffected
+
+
+async def _validate_and_close(findings: list[Finding]) -> list[Finding]:
+    """Validate findings, then close the clients the validation opened."""
+    try:
+        return await validate_findings(findings)
+    finally:
+        await _close_loop_clients()
+
+
 def validate_findings_sync(findings: list[Finding]) -> list[Finding]:
     """
     Synchronous wrapper for validate_findings.
 
+    Each call runs on its own event loop, closing the provider clients it
+    created before the loop is shut down.
+
     Args:
         findings: List of findings to validate
 
     Returns:
         Filtered list of findings
     """
-    import asyncio
-    return asyncio.run(validate_findings(findings))
+    return asyncio.run(_validate_and_close(findings))
@@ -1,5 +1,6 @@
 """FastAPI application for secrets scanner."""
 
+import asyncio
 import logging
 import os
 import uuid
@@ -58,12 +59,14 @@ async def scan(request: ScanRequest) -> ScanResult:
     repo_path = None
     try:
         # Clone the repository
+        # Cloning and scanning block, so they run in worker threads to keep
+        # the event loop free for other requests.
         logger.info(f"Cloning repository: {request.repo_url}")
-        repo_path = clone_repo(request.repo_url, request.branch)
+        repo_path = await asyncio.to_thread(clone_repo, request.repo_url, request.branch)
 
         # Scan the repository
         logger.info(f"Scanning repository at: {repo_path}")
-        findings = scan_directory(repo_path)
+        findings = await asyncio.to_thread(scan_directory, repo_path)
 
         # Generate summary
         if not findings:
@@ -88,7 +91,7 @@ async def scan(request: ScanRequest) -> ScanResult:
     finally:
         # Clean up temp directory
         if repo_path:
-            cleanup_repo(repo_path)
+            await asyncio.to_thread(cleanup_repo, repo_path)
 
 
 @app.post("/scan/deep", response_model=ScanResult)
@@ -103,15 +106,17 @@ async def scan_deep(request: DeepScanRequest) -> ScanResult:
     try:
         # Clone the repository with full history
         logger.info(f"Cloning repository with full history: {request.repo_url}")
-        repo_path = clone_repo_full(request.repo_url)
+        repo_path = await asyncio.to_thread(clone_repo_full, request.repo_url)
 
         # Scan current files
         logger.info(f"Scanning current files at: {repo_path}")
-        current_findings = scan_directory(repo_path)
+        current_findings = await asyncio.to_thread(scan_directory, repo_path)
 
         # Scan git history
         logger.info("Scanning git history...")
-        history_findings = scan_git_history(repo_path, request.rotated_keys)
+        history_findings = await asyncio.to_thread(
+            scan_git_history, repo_path, request.rotated_keys
+        )
 
         # Mark rotated keys in current findings too
         if request.rotated_keys:
@@ -151,4 +156,4 @@ async def scan_deep(request: DeepScanRequest) -> ScanResult:
     finally:
         # Clean up temp directory
         if repo_path:
-            cleanup_repo(repo_path)
+            await asyncio.to_thread(cleanup_repo, repo_path)
@@ -0,0 +1,139 @@
+"""On-disk cache of per-file scan results, so re-scans skip unchanged files."""
+
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+from .models import Finding
+
+_FINDING_LIST = TypeAdapter(list[Finding])
+
+# Modules whose code decides what a scan finds; editing either one
+# invalidates every cached result
+_SCANNER_MODULES = ("patterns.py", "scanner.py")
+
+# Files modified this recently are scanned but not cached: an edit that keeps
+# the size within the filesystem's timestamp granularity would go unnoticed
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _scanner_fingerprint() -> str:
+    """Hash of the scanner's source, stored with the cache to detect upgrades."""
+    digest = hashlib.sha1()
+    for name in _SCANNER_MODULES:
+        digest.update(Path(__file__).with_name(name).read_bytes())
+    return digest.hexdigest()
+
+
+class ScanCache:
+    """
+    SQLite store of each file's findings, reused while its size and mtime match.
+
+    Entries also record the path findings were reported under, so scans with
+    a different base_path don't reuse them. New results are written in one
+    transaction when the cache is closed. SQLite errors after opening
+    degrade to cache misses rather than failing the scan.
+    """
+
+    def __init__(self, db_path: str | Path):
+        self._conn = sqlite3.connect(db_path)
+        self._pending: list[tuple[str, str, int, int, bytes]] = []
+        try:
+            self._prepare(_scanner_fingerprint())
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def _prepare(self, fingerprint: str) -> None:
+        """Create the tables, dropping entries from a different scanner version."""
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "path TEXT PRIMARY KEY, display_path TEXT, size INTEGER, "
+                "mtime_ns INTEGER, findings BLOB)"
+            )
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'fingerprint'"
+            ).fetchone()
+            if row is None or row[0] != fingerprint:
+                self._conn.execute("DELETE FROM files")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (fingerprint,)
+                )
+
+    def __enter__(self) -> "ScanCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def file_key(file_path: str) -> tuple[int, int] | None:
+        """Return (size, mtime_ns) for file_path, or None if it can't be cached."""
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None
+        if file_stat.st_mtime_ns > time.time_ns() - RACY_WINDOW_NS:
+            return None
+        return file_stat.st_size, file_stat.st_mtime_ns
+
+    def get(
+        self, file_path: str, display_path: str, key: tuple[int, int] | None
+    ) -> list[Finding] | None:
+        """Return the cached findings for file_path, or None on a miss."""
+        if key is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT display_path, size, mtime_ns, findings FROM files WHERE path = ?",
+                (file_path,),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or row[0] != display_path or (row[1], row[2]) != key:
+            return None
+        return _FINDING_LIST.validate_json(row[3])
+
+    def put(
+        self,
+        file_path: str,
+        display_path: str,
+        key: tuple[int, int] | None,
+        findings: list[Finding],
+    ) -> None:
+        """Queue findings for file_path, as scanned when it had the given key."""
+        if key is None:
+            return
+        # Serialised now, before callers can modify the findings
+        self._pending.append(
+            (file_path, display_path, key[0], key[1], _FINDING_LIST.dump_json(findings))
+        )
+
+    def close(self) -> None:
+        """Write queued results and close the database."""
+        if self._pending:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)", self._pending
+                    )
+            except sqlite3.Error:
+                pass
+            self._pending = []
+        self._conn.close()
+
+
+def open_cache(db_path: str | Path) -> ScanCache | None:
+    """Open the cache at db_path, or return None if it can't be used."""
+    try:
+        return ScanCache(db_path)
+    except (OSError, sqlite3.Error):
+        return None
@@ -1,14 +1,38 @@
 """File and directory scanning for secrets."""
 
+import multiprocessing
 import os
 import re
+import stat
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from .models import Finding
-from .patterns import SECRET_PATTERNS
+from .patterns import (
+    COMBINED_PATTERN,
+    COMBINED_PATTERN_ASCII,
+    DEFAULT_RECOMMENDATION,
+    LINE_PATTERNS,
+    LINE_PATTERNS_ASCII,
+    MULTILINE_PATTERNS,
+    PATTERN_LITERALS,
+    RECOMMENDATIONS,
+    SECRET_PATTERNS,
+    hyperscan_database,
+    preload_hyperscan_database,
+    serialized_hyperscan_database,
+)
+from .scan_cache import open_cache
 
 # Directories to skip during scanning
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     "node_modules",
     ".git",
     "venv",
@@ -41,9 +65,14 @@ SKIP_DIRS = {
     # Python tooling
     ".tox",
     ".eggs",
-}
+})
+
+# Position of each pattern, to order findings that share a line
+_PATTERN_ORDER = {name: index for index, name in enumerate(SECRET_PATTERNS)}
 
-# Binary file extensions to skip
+# Binary file extensions to skip. Only the last suffix is compared, and
+# minified bundles (.min.js) are scanned on purpose: build tools inline
+# keys into them
 BINARY_EXTENSIONS = {
     ".png", ".jpg", ".jpeg", ".gif", ".ico", ".webp", ".svg",
     ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
@@ -52,7 +81,7 @@ BINARY_EXTENSIONS = {
     ".woff", ".woff2", ".ttf", ".eot",
     ".mp3", ".mp4", ".avi", ".mov", ".wav",
     ".pyc", ".pyo", ".class", ".o",
-    ".lock", ".min.js", ".min.css",
+    ".lock",
 }
 
 
@@ -79,15 +108,20 @@ FAKE_CREDENTIAL_PATTERNS = [
     r"api_key_here",
 ]
 
+# The credential patterns above contain no regex operators, so both lists
+# are checked as plain substrings, in priority order.
+_FAKE_NEEDLES = (*FAKE_VALUE_INDICATORS, *FAKE_CREDENTIAL_PATTERNS)
+
+
+# Stripe and Clerk keys share a format, so the same value is usually checked
+# twice in a row
+@lru_cache(maxsize=4096)
 def is_fake_value(value: str) -> tuple[bool, str | None]:
     """Check if a value looks like fake test data. Returns (is_fake, indicator_found)."""
     value_lower = value.lower()
-    for indicator in FAKE_VALUE_INDICATORS:
-        if indicator in value_lower:
-            return True, indicator
-    for pattern in FAKE_CREDENTIAL_PATTERNS:
-        if re.search(pattern, value_lower):
-            return True, pattern
+    for needle in _FAKE_NEEDLES:
+        if needle in value_lower:
+            return True, needle
     return False, None
 
 
@@ -134,6 +168,8 @@ _SQL_DDL_RE = re.compile(
 )
 
 
+# Called once per generic match, and both generic patterns often hit one line
+@lru_cache(maxsize=4096)
 def is_code_declaration(line: str) -> tuple[bool, str | None]:
     """Check if a line is a code declaration rather than a secret assignment.
 
@@ -163,17 +199,11 @@ def is_code_declaration(line: str) -> tuple[bool, str | None]:
 
 
 # Known non-secret keywords that appear as captured values
-_LOW_ENTROPY_KEYWORDS = {
+_LOW_ENTROPY_KEYWORDS = frozenset({
     "password", "passwd", "pwd", "secret", "string", "str",
     "none", "null", "undefined", "required", "optional",
     "true", "false", "changeme", "redacted", "encrypted",
-}
-
-# Repeating character pattern: xxxxxxxx, ********
-_REPEATING_CHAR_RE = re.compile(r"^(.)\1{7,}$")
-
-# Single plain English word: no digits/special chars, under 20 chars
-_PLAIN_WORD_RE = re.compile(r"^[a-zA-Z]{1,19}$")
+})
 
 
 def is_low_entropy_value(value: str) -> tuple[bool, str | None]:
@@ -181,13 +211,16 @@ def is_low_entropy_value(value: str) -> tuple[bool, str | None]:
 
     Returns (is_low_entropy, reason).
     """
-    if value.lower() in _LOW_ENTROPY_KEYWORDS:
-        return True, f"Known keyword: {value.lower()}"
+    lowered = value.lower()
+    if lowered in _LOW_ENTROPY_KEYWORDS:
+        return True, f"Known keyword: {lowered}"
 
-    if _REPEATING_CHAR_RE.match(value):
+    # Repeating characters: xxxxxxxx, ********
+    if len(value) >= 8 and len(set(value)) == 1:
         return True, "Repeating characters"
 
-    if _PLAIN_WORD_RE.match(value):
+    # Single plain English word: no digits/special chars, under 20 chars
+    if len(value) < 20 and value.isascii() and value.isalpha():
         return True, f"Single plain word: {value}"
 
     return False, None
@@ -209,30 +242,255 @@ def get_file_context_reason(file_path: str) -> str | None:
     return None
 
 
-def is_binary_file(file_path: Path) -> bool:
+def is_binary_file(file_path: str | Path) -> bool:
     """Check if a file is binary based on extension or content."""
-    if file_path.suffix.lower() in BINARY_EXTENSIONS:
+    if os.path.splitext(file_path)[1].lower() in BINARY_EXTENSIONS:
         return True
+    # Same NUL-byte sniff as _read_chunks(): one unbuffered 1 KiB read, and
+    # bytes.find() (a memchr) rather than a Python-level loop
     try:
-        with open(file_path, "rb") as f:
-            chunk = f.read(1024)
-            if b"\x00" in chunk:
-                return True
+        with open(file_path, "rb", buffering=0) as f:
+            return f.read(1024).find(b"\x00") != -1
     except (IOError, OSError):
         return True
-    return False
 
 
 def get_recommendation(pattern_name: str, severity: str) -> str:
     """Generate a recommendation based on the finding type."""
-    recommendations = {
-        "critical": "Rotate this credential immediately and remove from codebase.",
-        "high": "Rotate this credential and use environment variables instead.",
-        "medium": "Consider using environment variables for this value.",
-        "low": "Review if this should be in the codebase.",
-        "info": "Informational finding - review as needed.",
+    return RECOMMENDATIONS.get(severity, DEFAULT_RECOMMENDATION)
+
+
+def _finding_fields(
+    pattern_name: str,
+    pattern_info: dict,
+    secret_value: str,
+    line: str,
+    line_num: int,
+    display_path: str,
+    file_context_reason: str | None,
+) -> dict:
+    """
+    Build the Finding fields for one match, with false-positive reasoning attached.
+
+    file_context_reason is get_file_context_reason(display_path), computed
+    once per file by the caller.
+    """
+    # Build reasoning from multiple signals
+    reasons = []
+    if file_context_reason:
+        reasons.append(file_context_reason)
+    is_fake, fake_indicator = is_fake_value(secret_value)
+    if is_fake:
+        reasons.append(f"Value looks like test data (contains '{fake_indicator}')")
+
+    # Additional FP checks for generic patterns only
+    if pattern_name in GENERIC_PATTERN_NAMES:
+        is_decl, decl_reason = is_code_declaration(line)
+        if is_decl:
+            reasons.append(f"Code declaration: {decl_reason}")
+        is_low, low_reason = is_low_entropy_value(secret_value)
+        if is_low:
+            reasons.append(f"Low-entropy value: {low_reason}")
+
+    fp_reason = "; ".join(reasons) if reasons else None
+
+    return {
+        "type": pattern_name,
+        "severity": pattern_info["severity"],
+        "file": display_path,
+        "line": line_num,
+        "preview": redact_secret(secret_value),
+        "in_history": False,
+        "rotated": False,
+        "recommendation": pattern_info["recommendation"],
+        "likely_false_positive": fp_reason is not None,
+        "fp_reason": fp_reason,
     }
-    return recommendations.get(severity, "Review this finding.")
+
+
+# Validates a file's worth of finding fields in one call, which is cheaper
+# than constructing each Finding separately.
+_FINDING_LIST = TypeAdapter(list[Finding])
+
+
+def _gated_lines(buffer, gate, newline) -> Iterator[tuple[int, int, int]]:
+    """
+    Yield (line number, start, end) for each line of buffer the gate matches.
+
+    Searches the whole buffer and resumes at the next line after each hit,
+    so a line is reported at most once.
+    """
+    pos = 0
+    line_num = 1
+    while (hit := gate.search(buffer, pos)) is not None:
+        previous = buffer.rfind(newline, pos, hit.start())
+        line_start = pos if previous == -1 else previous + 1
+        line_end = buffer.find(newline, hit.start()) + 1 or len(buffer)
+        line_num += buffer.count(newline, pos, line_start)
+        yield line_num, line_start, line_end
+        pos = line_end
+        line_num += 1
+
+
+# Per-thread Hyperscan scratch space: a scratch can't be used by two scans
+# at once, and the API scans from several threads
+_thread_scratch = threading.local()
+
+
+def _hyperscan_scratch(database):
+    """Return this thread's scratch space for database, cloning one on first use."""
+    cached = getattr(_thread_scratch, "value", None)
+    if cached is None or cached[0] is not database:
+        cached = (database, database.scratch.clone())
+        _thread_scratch.value = cached
+    return cached[1]
+
+
+def _hyperscan_lines(buffer: bytes, database) -> Iterator[tuple[int, int, int, set[int]]]:
+    """
+    Yield (line number, start, end, pattern ids) for each line Hyperscan flags.
+
+    The ids are the LINE_PATTERNS indexes of every match ending on the line,
+    which covers every pattern that can match within it.
+    """
+    spans: list[tuple[int, int, set[int]]] = []
+
+    def on_match(pattern_id, start, end, flags, context):
+        # Matches arrive in order of end offset, so a line's matches are
+        # reported together
+        if spans and end <= spans[-1][1]:
+            spans[-1][2].add(pattern_id)
+        else:
+            last = end - 1
+            spans.append((
+                buffer.rfind(b"\n", 0, last) + 1,
+                buffer.find(b"\n", last) + 1 or len(buffer),
+                {pattern_id},
+            ))
+
+    database.scan(buffer, match_event_handler=on_match, scratch=_hyperscan_scratch(database))
+
+    pos = 0
+    line_num = 1
+    for line_start, line_end, pattern_ids in spans:
+        line_num += buffer.count(b"\n", pos, line_start)
+        yield line_num, line_start, line_end, pattern_ids
+        pos = line_end
+        line_num += 1
+
+
+def _candidate_lines(content: str | bytes) -> Iterator[tuple[int, str, set[int] | None]]:
+    """
+    Yield (line number, line, pattern ids) for each line the fused pattern may match.
+
+    ASCII content (bytes from _read_chunks()) is prefiltered by Hyperscan, or
+    else RE2, when one is installed, decoding only the flagged lines;
+    everything else goes through the stdlib COMBINED_PATTERN.
+    Only Hyperscan reports which patterns matched; otherwise the ids are None.
+    """
+    if isinstance(content, bytes):
+        database = hyperscan_database()
+        if database is not None:
+            for line_num, line_start, line_end, pattern_ids in _hyperscan_lines(content, database):
+                yield line_num, content[line_start:line_end].decode("ascii"), pattern_ids
+            return
+        if COMBINED_PATTERN_ASCII is not None:
+            for line_num, line_start, line_end in _gated_lines(content, COMBINED_PATTERN_ASCII, b"\n"):
+                yield line_num, content[line_start:line_end].decode("ascii"), None
+            return
+        content = content.decode("ascii")
+
+    for line_num, line_start, line_end in _gated_lines(content, COMBINED_PATTERN, "\n"):
+        yield line_num, content[line_start:line_end], None
+
+
+# Files larger than this are read and scanned CHUNK_SIZE at a time, so
+# memory stays bounded on multi-megabyte logs and dumps
+LARGE_FILE_SIZE = 8 * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+# How much of the next chunk the private key patterns may need to complete a
+# match that starts near the end of a chunk: the longest header, a newline
+# and the 64 key characters they require
+_CHUNK_LOOKAHEAD = 128
+
+
+def _read_chunks(file_path: str | Path) -> Iterable[str | bytes]:
+    """
+    Read a file for scanning as consecutive chunks of whole lines.
+
+    Files up to LARGE_FILE_SIZE are read at once into a single chunk; larger
+    ones are read lazily, CHUNK_SIZE at a time. Pure ASCII chunks are
+    returned as bytes, since the prefilters scan bytes and ASCII needs no
+    decoding; anything else is decoded to str. Either way newlines are
+    normalised to "\\n".
+
+    Yields nothing for non-files, binary extensions, empty or unreadable
+    files and files with a NUL byte in their first 1 KiB.
+    """
+    # Extension first: it needs no syscall
+    if os.path.splitext(file_path)[1].lower() in BINARY_EXTENSIONS:
+        return ()
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return ()
+    # Empty files can't hold secrets, so don't open them
+    if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+        return ()
+    if file_stat.st_size > LARGE_FILE_SIZE:
+        return _iter_chunks(file_path)
+
+    # One binary read serves both the NUL-byte sniff and the scan. Unbuffered,
+    # read() is a single read sized from the file, with no buffer to fill.
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            raw = f.read()
+    except (IOError, OSError):
+        return ()
+    if raw.find(b"\x00", 0, 1024) != -1:
+        return ()
+    return (_decode_text(raw),)
+
+
+def _iter_chunks(file_path: str | Path) -> Iterator[str | bytes]:
+    """Yield a large file in chunks of about CHUNK_SIZE, split after a newline."""
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            block = f.read(CHUNK_SIZE)
+            if block.find(b"\x00", 0, 1024) != -1:
+                return
+            # Splitting after "\n" keeps "\r\n" pairs and UTF-8 sequences
+            # whole; a line with no "\n" in a block grows the chunk instead
+            parts = []
+            while block:
+                cut = block.rfind(b"\n") + 1
+                if cut:
+                    parts.append(block[:cut])
+                    yield _decode_text(b"".join(parts))
+                    parts = [block[cut:]]
+                else:
+                    parts.append(block)
+                block = f.read(CHUNK_SIZE)
+            tail = b"".join(parts)
+            if tail:
+                yield _decode_text(tail)
+    except (IOError, OSError):
+        return
+
+
+def _decode_text(raw: bytes) -> str | bytes:
+    """Return raw with newlines normalised, decoded unless it is pure ASCII."""
+    if raw.isascii():
+        if b"\r" in raw:
+            raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        return raw
+
+    # Decode in one go and translate newlines the way text-mode reads did
+    content = raw.decode("utf-8", errors="ignore")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
 
 def scan_file(file_path: str | Path, base_path: str | Path | None = None) -> list[Finding]:
@@ -246,79 +504,299 @@ def scan_file(file_path: str | Path, base_path: str | Path | None = None) -> lis
     Returns:
         List of Finding objects
     """
+    return _scan_path(file_path, _display_path(file_path, base_path))
+
+
+def _display_path(file_path: str | Path, base_path: str | Path | None) -> str:
+    """Return the path shown in findings: relative to base_path when under it."""
     file_path = Path(file_path)
+    if base_path:
+        try:
+            return str(file_path.relative_to(base_path))
+        except ValueError:
+            pass
+    return str(file_path)
 
-    if not file_path.exists() or not file_path.is_file():
-        return []
 
-    if is_binary_file(file_path):
-        return []
+def _scan_path(file_path: str | Path, display_path: str) -> list[Finding]:
+    """Read and scan one file, reporting findings under display_path."""
+    return _scan_chunks(_read_chunks(file_path), display_path)
 
+
+def _scan_chunks(chunks: Iterable[str | bytes], display_path: str) -> list[Finding]:
+    """Scan the chunks of one file, as returned by _read_chunks(), in order."""
     findings = []
+    line_offset = 0
+    chunks = iter(chunks)
+    chunk = next(chunks, None)
+    while chunk is not None:
+        following = next(chunks, None)
+        lookahead = ""
+        if following is not None:
+            lookahead = following[:_CHUNK_LOOKAHEAD]
+            if isinstance(lookahead, bytes):
+                lookahead = lookahead.decode("ascii")
+        findings += _scan_text(chunk, display_path, line_offset, lookahead)
+        line_offset += chunk.count(b"\n" if isinstance(chunk, bytes) else "\n")
+        chunk = following
+    return findings
 
-    # Determine relative path for display
-    if base_path:
-        try:
-            display_path = str(file_path.relative_to(base_path))
-        except ValueError:
-            display_path = str(file_path)
-    else:
-        display_path = str(file_path)
 
+# Lines longer than this (minified bundles, generated data) are matched with
+# RE2 when it is installed: patterns like postgres_uri can backtrack
+# quadratically in re on long lines with many near-misses.
+LONG_LINE_LENGTH = 4096
+
+
+# (name, info, required literals, case-insensitive) for each line pattern
+_LINE_PATTERN_LITERALS = [
+    (name, info, PATTERN_LITERALS[name], bool(info["regex"].flags & re.IGNORECASE))
+    for name, info in LINE_PATTERNS.items()
+]
+
+
+def _possible_patterns(line: str, pattern_ids: set[int] | None) -> list[tuple[str, dict]]:
+    """
+    Return the line patterns that may match line.
+
+    These are the patterns in pattern_ids (LINE_PATTERNS indexes reported by
+    the prefilter; None means all of them) whose required literals occur.
+    """
+    # re's case-insensitive matching folds a few non-ASCII letters (e.g. the
+    # long s) onto ASCII ones, so (?i) literals are only checked on ASCII lines
+    folded = line.lower() if line.isascii() else None
+    possible = []
+    for index, (pattern_name, pattern_info, literals, ignore_case) in enumerate(
+        _LINE_PATTERN_LITERALS
+    ):
+        if pattern_ids is not None and index not in pattern_ids:
+            continue
+        haystack = folded if ignore_case else line
+        if haystack is None or any(literal in haystack for literal in literals):
+            possible.append((pattern_name, pattern_info))
+    return possible
+
+
+def _line_secrets(line: str, pattern_ids: set[int] | None = None) -> Iterator[tuple[str, dict, str]]:
+    """
+    Yield (pattern name, pattern info, secret value) for each match in line.
+
+    Line patterns have at most one capturing group, which always takes part
+    in a match, so findall() returns the secret value (the group if there is
+    one, else the whole match) without building Match objects.
+    """
+    patterns = _possible_patterns(line, pattern_ids)
+    if len(line) > LONG_LINE_LENGTH and LINE_PATTERNS_ASCII is not None and line.isascii():
+        data = line.encode("ascii")
+        for pattern_name, pattern_info in patterns:
+            for secret_value in LINE_PATTERNS_ASCII[pattern_name].findall(data):
+                yield pattern_name, pattern_info, secret_value.decode("ascii")
+        return
+
+    for pattern_name, pattern_info in patterns:
+        for secret_value in pattern_info["regex"].findall(line):
+            yield pattern_name, pattern_info, secret_value
+
+
+def _has_literal(content: str | bytes, literals: tuple[str, ...]) -> bool:
+    """Return whether any of the (ASCII) literals occurs in content."""
+    if isinstance(content, bytes):
+        return any(literal.encode("ascii") in content for literal in literals)
+    return any(literal in content for literal in literals)
+
+
+def _scan_text(
+    content: str | bytes, display_path: str, line_offset: int = 0, lookahead: str = ""
+) -> list[Finding]:
+    """
+    Scan one chunk of file text, as returned by _read_chunks(), for secrets.
+
+    line_offset is the number of lines in the file before the chunk, and
+    lookahead the start of the next chunk, where a private key block that
+    starts in this chunk may end.
+    """
+    findings = []
+    file_context_reason = get_file_context_reason(display_path)
+
+    # Run the individual line patterns only on lines the prefilter flags
+    for line_num, line, pattern_ids in _candidate_lines(content):
+        for pattern_name, pattern_info, secret_value in _line_secrets(line, pattern_ids):
+            findings.append(
+                _finding_fields(
+                    pattern_name,
+                    pattern_info,
+                    secret_value,
+                    line,
+                    line_num + line_offset,
+                    display_path,
+                    file_context_reason,
+                )
+            )
+
+    # Private key blocks span lines; report them at their first line, using
+    # that header line as the value so the preview stays short.
+    multiline_found = False
+    for pattern_name, pattern_info in MULTILINE_PATTERNS.items():
+        if not _has_literal(content, PATTERN_LITERALS[pattern_name]):
+            continue
+        if isinstance(content, bytes):
+            content = content.decode("ascii")
+        # Matches come in order, so count newlines from the previous one on
+        line_num = line_offset + 1
+        counted_to = 0
+        for match in pattern_info["regex"].finditer(content + lookahead):
+            # Blocks starting in the lookahead are the next chunk's to report
+            if match.start() >= len(content):
+                break
+            line_num += content.count("\n", counted_to, match.start())
+            counted_to = match.start()
+            header = match.group(0).split("\n", 1)[0]
+            findings.append(
+                _finding_fields(
+                    pattern_name,
+                    pattern_info,
+                    header,
+                    header,
+                    line_num,
+                    display_path,
+                    file_context_reason,
+                )
+            )
+            multiline_found = True
+
+    if multiline_found:
+        findings.sort(key=lambda fields: (fields["line"], _PATTERN_ORDER[fields["type"]]))
+
+    return _FINDING_LIST.validate_python(findings) if findings else []
+
+
+# Below this many files the process pool start-up costs more than it saves
+PARALLEL_MIN_FILES = 256
+
+# Upper bound on files handed to a worker per dispatch
+MAX_CHUNKSIZE = 32
+
+# Reader threads and read-ahead window for sequential scans
+READER_THREADS = 4
+PREFETCH_DEPTH = 64
+
+
+def _available_cpus() -> int:
+    """Number of CPUs this process may run on (honours affinity on Linux)."""
     try:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            for line_num, line in enumerate(f, start=1):
-                for pattern_name, pattern_info in SECRET_PATTERNS.items():
-                    matches = pattern_info["regex"].finditer(line)
-                    for match in matches:
-                        # Get the matched value (use group 1 if it exists, else group 0)
-                        try:
-                            secret_value = match.group(1) if match.lastindex else match.group(0)
-                        except IndexError:
-                            secret_value = match.group(0)
-
-                        # Build reasoning from multiple signals
-                        reasons = []
-                        if file_context_reason := get_file_context_reason(display_path):
-                            reasons.append(file_context_reason)
-                        is_fake, fake_indicator = is_fake_value(secret_value)
-                        if is_fake:
-                            reasons.append(f"Value looks like test data (contains '{fake_indicator}')")
-
-                        # Additional FP checks for generic patterns only
-                        if pattern_name in GENERIC_PATTERN_NAMES:
-                            is_decl, decl_reason = is_code_declaration(line)
-                            if is_decl:
-                                reasons.append(f"Code declaration: {decl_reason}")
-                            is_low, low_reason = is_low_entropy_value(secret_value)
-                            if is_low:
-                                reasons.append(f"Low-entropy value: {low_reason}")
-
-                        fp_reason = "; ".join(reasons) if reasons else None
-
-                        finding = Finding(
-                            type=pattern_name,
-                            severity=pattern_info["severity"],
-                            file=display_path,
-                            line=line_num,
-                            preview=redact_secret(secret_value),
-                            in_history=False,
-                            rotated=False,
-                            recommendation=get_recommendation(pattern_name, pattern_info["severity"]),
-                            likely_false_positive=fp_reason is not None,
-                            fp_reason=fp_reason,
-                        )
-                        findings.append(finding)
-    except (IOError, OSError):
-        pass
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
 
-    return findings
+
+def _pool_context():
+    """
+    Return the multiprocessing context for scan worker processes.
+
+    Workers are never forked directly from this process: the API runs scans
+    in worker threads, and a fork could copy locks other threads hold. The
+    forkserver instead forks them from a clean server process that has
+    already imported this module.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _scan_files(file_paths: list[str], display_paths: list[str]) -> Iterator[list[Finding]]:
+    """
+    Scan files in a process pool when worthwhile, yielding results in order.
+
+    Matching is CPU-bound and independent per file, so it parallelises
+    across processes. Falls back to a sequential loop for small trees or if
+    a process pool cannot be started (e.g. sandboxes without /dev/shm).
+    """
+    workers = min(_available_cpus(), len(file_paths))
+    if len(file_paths) >= PARALLEL_MIN_FILES and workers > 1:
+        chunksize = max(1, min(MAX_CHUNKSIZE, len(file_paths) // (workers * 4)))
+        # Pool start-up failures surface here, before any result is yielded
+        executor = None
+        try:
+            # Workers load the database compiled here rather than each
+            # spending the compile time again
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=_pool_context(),
+                initializer=preload_hyperscan_database,
+                initargs=(serialized_hyperscan_database(),),
+            )
+            results = executor.map(_scan_path, file_paths, display_paths, chunksize=chunksize)
+        except (OSError, NotImplementedError):
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        else:
+            with executor:
+                yield from results
+            return
+    yield from _scan_files_prefetched(file_paths, display_paths)
+
+
+def _scan_files_prefetched(
+    file_paths: list[str], display_paths: list[str]
+) -> Iterator[list[Finding]]:
+    """
+    Scan files in order on this thread while reader threads load the next ones.
+
+    Keeps up to PREFETCH_DEPTH reads in flight, so waiting on slow disks or
+    network filesystems overlaps with matching instead of adding to it.
+    """
+    remaining = iter(file_paths)
+    with ThreadPoolExecutor(max_workers=READER_THREADS) as readers:
+        pending = deque(
+            readers.submit(_read_chunks, file_path)
+            for file_path in islice(remaining, PREFETCH_DEPTH)
+        )
+        for display_path in display_paths:
+            read = pending.popleft()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append(readers.submit(_read_chunks, next_path))
+            yield _scan_chunks(read.result(), display_path)
+
+
+def _walk_files(dir_path: str | Path, skip: frozenset[str]) -> list[str]:
+    """
+    List the files under dir_path, in the order os.walk() would yield them.
+
+    Uses os.scandir() directly so each entry's type comes from the cached
+    directory listing, and pruned directories are never listed. Like
+    os.walk(), symlinked directories are not followed and unreadable
+    directories are skipped.
+    """
+    files = []
+    stack = [dir_path]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry.path)
+                    elif entry.name not in skip and not entry.is_symlink():
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        # Depth-first, visiting subdirectories in listing order
+        stack.extend(reversed(subdirs))
+    return files
 
 
 def scan_directory(
     dir_path: str | Path,
     base_path: str | Path | None = None,
     extra_skip_dirs: set[str] | None = None,
+    cache_path: str | Path | None = None,
 ) -> list[Finding]:
     """
     Recursively scan a directory for secrets.
@@ -327,29 +805,70 @@ def scan_directory(
         dir_path: Path to the directory to scan
         base_path: Base path for relative file paths in findings
         extra_skip_dirs: Additional directory names to skip (merged with SKIP_DIRS)
+        cache_path: SQLite file to reuse results from for files unchanged
+            since the last scan that used it (created if missing)
 
     Returns:
         List of Finding objects
     """
-    dir_path = Path(dir_path)
-
-    if not dir_path.exists() or not dir_path.is_dir():
-        return []
+    return list(iter_scan_directory(dir_path, base_path, extra_skip_dirs, cache_path))
 
-    if base_path is None:
-        base_path = dir_path
 
-    skip = SKIP_DIRS | extra_skip_dirs if extra_skip_dirs else SKIP_DIRS
+def iter_scan_directory(
+    dir_path: str | Path,
+    base_path: str | Path | None = None,
+    extra_skip_dirs: set[str] | None = None,
+    cache_path: str | Path | None = None,
+) -> Iterator[Finding]:
+    """
+    Recursively scan a directory for secrets, yielding findings as files are scanned.
 
-    findings = []
+    Same arguments and findings, in the same order, as scan_directory(), but
+    only one file's findings are held at a time, so callers that stream
+    results don't keep a whole large tree's findings in memory.
+    """
+    dir_path = Path(dir_path)
 
-    for root, dirs, files in os.walk(dir_path):
-        # Filter out directories to skip
-        dirs[:] = [d for d in dirs if d not in skip]
+    if not dir_path.exists() or not dir_path.is_dir():
+        return
 
-        for file_name in files:
-            file_path = Path(root) / file_name
-            file_findings = scan_file(file_path, base_path)
-            findings.extend(file_findings)
+    skip = SKIP_DIRS | extra_skip_dirs if extra_skip_dirs else SKIP_DIRS
 
-    return findings
+    # Collect the file list first so the scans can be farmed out. Paths stay
+    # plain strings; Path objects are only built for a custom base_path.
+    file_paths = _walk_files(dir_path, skip)
+    if base_path is None:
+        # Every walked path is dir_path + separator + relative path
+        prefix_length = len(os.path.join(dir_path, ""))
+        display_paths = [file_path[prefix_length:] for file_path in file_paths]
+    else:
+        display_paths = [_display_path(file_path, base_path) for file_path in file_paths]
+
+    # An unusable cache (unwritable location, not a database) means an
+    # uncached scan rather than a failed one
+    cache = open_cache(cache_path) if cache_path is not None else None
+    if cache is None:
+        for file_findings in _scan_files(file_paths, display_paths):
+            yield from file_findings
+        return
+
+    with cache:
+        keys = [cache.file_key(file_path) for file_path in file_paths]
+        cached = [
+            cache.get(file_path, display_path, key)
+            for file_path, display_path, key in zip(file_paths, display_paths, keys)
+        ]
+        # Only files without cached results are scanned; their results come
+        # back in order and slot into the gaps
+        misses = [index for index, findings in enumerate(cached) if findings is None]
+        scanned = _scan_files(
+            [file_paths[index] for index in misses],
+            [display_paths[index] for index in misses],
+        )
+        for file_path, display_path, key, file_findings in zip(
+            file_paths, display_paths, keys, cached
+        ):
+            if file_findings is None:
+                file_findings = next(scanned)
+                cache.put(file_path, display_path, key, file_findings)
+            yield from file_findings
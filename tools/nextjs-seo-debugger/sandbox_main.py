@@ -24,6 +24,27 @@ from nextjs_seo_debugger.models import (
 
 GOOGLEBOT_UA = "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)"
 
+# Internal pages checked at once, so large max_pages values don't flood the site
+MAX_CONCURRENT_PAGES = 8
+
+# Longest one internal page check (including its redirects) may take, so a
+# single slow page can't hold up the whole scan
+PAGE_CHECK_TIMEOUT = 10.0
+
+# Idle connections kept open to the site (enough for every concurrent check),
+# so later requests skip the TCP+TLS handshake instead of reconnecting
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 30.0
+
+
+def _http2_available() -> bool:
+    """Return True if the h2 package httpx needs for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
 
 async def run_debug(debug_input: DebugInput) -> DebugReport:
     """Run the full SEO debug scan.
@@ -48,9 +69,7 @@ async def run_debug(debug_input: DebugInput) -> DebugReport:
         url = "https://" + url
 
     scan_time = datetime.now(timezone.utc).isoformat()
-    pages: list[PageResult] = []
     sitemap_result = SitemapResult()
-    robots_result = RobotsResult()
 
     headers = {
         "User-Agent": GOOGLEBOT_UA,
@@ -59,14 +78,50 @@ async def run_debug(debug_input: DebugInput) -> DebugReport:
         "Accept-Encoding": "gzip, deflate",
     }
 
-    async with httpx.AsyncClient(
-        headers=headers,
-        verify=False,  # Handle SSL errors gracefully
-        timeout=15.0,
-    ) as client:
+    page_slots = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+    async def check_link(link: str, client: httpx.AsyncClient) -> PageResult:
+        """Check one internal page, turning errors into a failed result."""
+        try:
+            async with page_slots:
+                page_result, _ = await asyncio.wait_for(
+                    check_page(link, client, debug_input.follow_redirects),
+                    timeout=PAGE_CHECK_TIMEOUT,
+                )
+            return page_result
+        except asyncio.TimeoutError:
+            return PageResult(
+                url=link,
+                status_code=0,
+                checks=[
+                    SEOCheck(
+                        name="connectivity",
+                        status="fail",
+                        message=f"Page check timed out after {PAGE_CHECK_TIMEOUT:.0f}s",
+                    )
+                ],
+            )
+        except Exception as e:
+            return PageResult(
+                url=link,
+                status_code=0,
+                checks=[
+                    SEOCheck(
+                        name="connectivity",
+                        status="fail",
+                        message=f"Error checking page: {str(e)}",
+                    )
+                ],
+            )
+
+    async def crawl_pages(client: httpx.AsyncClient) -> list[PageResult]:
+        """Check the main page, then the internal pages it links to."""
+        pages: list[PageResult] = []
+        main_parsed = None
+
         # 1. Check the main page
         try:
-            main_page = await check_page(url, client, debug_input.follow_redirects)
+            main_page, main_parsed = await check_page(url, client, debug_input.follow_redirects)
             pages.append(main_page)
         except Exception as e:
             pages.append(
@@ -85,58 +140,70 @@ async def run_debug(debug_input: DebugInput) -> DebugReport:
             )
 
         # 2. Crawl internal pages (if main page was successful)
-        if pages and pages[0].status_code == 200 and debug_input.max_pages > 1:
+        if main_parsed is not None and debug_input.max_pages > 1:
             try:
-                # Fetch main page HTML for link extraction
-                resp = await client.get(url, follow_redirects=True, timeout=10.0)
-                internal_links = find_internal_links(resp.text, url)
+                # Extract links from the page the main page check parsed
+                internal_links = find_internal_links(main_parsed, url)
 
                 # Limit to max_pages - 1 (main page already checked)
                 links_to_check = internal_links[: debug_input.max_pages - 1]
 
-                for link in links_to_check:
-                    try:
-                        page_result = await check_page(
-                            link, client, debug_input.follow_redirects
-                        )
-                        pages.append(page_result)
-                    except Exception as e:
-                        pages.append(
-                            PageResult(
-                                url=link,
-                                status_code=0,
-                                checks=[
-                                    SEOCheck(
-                                        name="connectivity",
-                                        status="fail",
-                                        message=f"Error checking page: {str(e)}",
-                                    )
-                                ],
-                            )
-                        )
+                # Each check is a few network round trips, so run them
+                # concurrently (up to MAX_CONCURRENT_PAGES at a time);
+                # gather() keeps the results in link order
+                pages.extend(
+                    await asyncio.gather(*(check_link(link, client) for link in links_to_check))
+                )
             except Exception:
                 pass  # Failed to extract links, continue with just the main page
 
-        # 3. Check sitemap
-        if debug_input.check_sitemap:
-            try:
-                sitemap_result = await check_sitemap(url, client)
-            except Exception as e:
-                sitemap_result = SitemapResult(
-                    found=False,
-                    url=url + "/sitemap.xml",
-                    issues=[f"Error checking sitemap: {str(e)}"],
-                )
+        return pages
+
+    async def sitemap_or_error(client: httpx.AsyncClient) -> SitemapResult:
+        """Check sitemap.xml, reporting errors in the result."""
+        try:
+            return await check_sitemap(url, client)
+        except Exception as e:
+            return SitemapResult(
+                found=False,
+                url=url + "/sitemap.xml",
+                issues=[f"Error checking sitemap: {str(e)}"],
+            )
 
-        # 4. Check robots.txt
+    async def robots_or_error(client: httpx.AsyncClient) -> RobotsResult:
+        """Check robots.txt, reporting errors in the result."""
         try:
-            robots_result = await check_robots(url, client)
+            return await check_robots(url, client)
         except Exception as e:
-            robots_result = RobotsResult(
+            return RobotsResult(
                 found=False,
                 issues=[f"Error checking robots.txt: {str(e)}"],
             )
 
+    # One pooled client is shared by every check; with h2 installed, requests
+    # to HTTP/2 sites are multiplexed over a single connection
+    async with httpx.AsyncClient(
+        headers=headers,
+        verify=False,  # Handle SSL errors gracefully
+        timeout=15.0,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+        http2=_http2_available(),
+    ) as client:
+        # The sitemap (3) and robots.txt (4) checks don't depend on the
+        # crawl, so they run alongside it on the same client
+        if debug_input.check_sitemap:
+            pages, robots_result, sitemap_result = await asyncio.gather(
+                crawl_pages(client), robots_or_error(client), sitemap_or_error(client)
+            )
+        else:
+            pages, robots_result = await asyncio.gather(
+                crawl_pages(client), robots_or_error(client)
+            )
+
     # 5. Build report
     report = DebugReport(
         url=url,
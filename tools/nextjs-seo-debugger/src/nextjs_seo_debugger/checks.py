@@ -5,7 +5,7 @@ Each function returns one or more SEOCheck objects with pass/fail/warn/info stat
 
 from urllib.parse import urlparse
 
-from nextjs_seo_debugger.models import CheckStatus, RedirectChain, SEOCheck
+from nextjs_seo_debugger.models import CheckStatus, ParsedPage, RedirectChain, SEOCheck
 
 
 def check_redirect_chain(chain: RedirectChain) -> SEOCheck:
@@ -422,7 +422,9 @@ def check_status_code(code: int) -> SEOCheck:
         )
 
 
-def check_nextjs_issues(html: str, headers: dict) -> list[SEOCheck]:
+def check_nextjs_issues(
+    html: str, headers: dict, page: ParsedPage | None = None
+) -> list[SEOCheck]:
     """Check for Next.js and Vercel-specific SEO issues.
 
     Detects:
@@ -435,6 +437,7 @@ def check_nextjs_issues(html: str, headers: dict) -> list[SEOCheck]:
     Args:
         html: The page HTML content.
         headers: The response headers dict.
+        page: The page already parsed from html, if available.
 
     Returns:
         List of SEOCheck results.
@@ -446,16 +449,13 @@ def check_nextjs_issues(html: str, headers: dict) -> list[SEOCheck]:
     has_next_div = 'id="__next"' in html or "id='__next'" in html
     if has_next_div:
         # Check if __next div is essentially empty (CSR-only)
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(html, "lxml")
-        next_div = soup.find(id="__next")
-        if next_div:
-            # Get text content, excluding script tags
-            for script in next_div.find_all("script"):
-                script.decompose()
-            text_content = next_div.get_text(strip=True)
+        if page is None:
+            from nextjs_seo_debugger.html_parser import parse_page
 
+            page = parse_page(html)
+        # Text content of the __next div, excluding script tags
+        text_content = page.next_text
+        if text_content is not None:
             if len(text_content) < 50:
                 checks.append(
                     SEOCheck(
@@ -8,7 +8,6 @@ from typing import Optional
 from urllib.parse import urljoin, urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 
 from nextjs_seo_debugger.checks import (
     check_canonical,
@@ -18,8 +17,10 @@ from nextjs_seo_debugger.checks import (
     check_redirect_chain,
     check_status_code,
 )
+from nextjs_seo_debugger.html_parser import parse_page
 from nextjs_seo_debugger.models import (
     PageResult,
+    ParsedPage,
     RedirectChain,
     RedirectHop,
     SEOCheck,
@@ -29,6 +30,12 @@ GOOGLEBOT_UA = "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/b
 REQUEST_TIMEOUT = 10.0
 MAX_REDIRECTS = 10
 
+# Links to these are resources rather than pages, so they aren't crawled
+SKIP_EXTENSIONS = (
+    ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp", ".ico",
+    ".css", ".js", ".pdf", ".zip", ".xml", ".json",
+)
+
 
 async def fetch_page(
     url: str,
@@ -128,58 +135,31 @@ def parse_meta_tags(html: str) -> dict:
     Returns:
         Dict containing title, description, canonical, robots, og:* tags.
     """
-    soup = BeautifulSoup(html, "lxml")
-    meta: dict = {}
-
-    # Title
-    title_tag = soup.find("title")
-    meta["title"] = title_tag.get_text(strip=True) if title_tag else None
-
-    # Meta description
-    desc_tag = soup.find("meta", attrs={"name": "description"})
-    meta["description"] = desc_tag.get("content", "") if desc_tag else None
-
-    # Canonical link
-    canonical_tag = soup.find("link", attrs={"rel": "canonical"})
-    meta["canonical"] = canonical_tag.get("href", "") if canonical_tag else None
-
-    # Robots meta
-    robots_tag = soup.find("meta", attrs={"name": "robots"})
-    meta["robots"] = robots_tag.get("content", "") if robots_tag else None
+    return parse_page(html).meta
 
-    # Googlebot-specific meta
-    googlebot_tag = soup.find("meta", attrs={"name": "googlebot"})
-    meta["googlebot"] = googlebot_tag.get("content", "") if googlebot_tag else None
 
-    # Open Graph tags
-    og_tags: dict[str, str] = {}
-    for tag in soup.find_all("meta", attrs={"property": True}):
-        prop = tag.get("property", "")
-        if prop.startswith("og:"):
-            og_tags[prop] = tag.get("content", "")
-    meta["og_tags"] = og_tags
-
-    return meta
-
-
-def find_internal_links(html: str, base_url: str) -> list[str]:
-    """Extract internal links from HTML for crawling additional pages.
+def find_internal_links(page: ParsedPage, base_url: str) -> list[str]:
+    """Extract internal links from a parsed page for crawling additional pages.
 
     Args:
-        html: The HTML content to parse.
+        page: The parsed page, from parse_page().
         base_url: The base URL to resolve relative links against.
 
     Returns:
         List of unique internal URLs found.
     """
-    soup = BeautifulSoup(html, "lxml")
     parsed_base = urlparse(base_url)
     base_domain = parsed_base.netloc
     seen: set[str] = set()
+    checked_hrefs: set[str] = set()
     links: list[str] = []
 
-    for a_tag in soup.find_all("a", href=True):
-        href = a_tag["href"]
+    for href in page.hrefs:
+        # Nav and footer links repeat on most pages; an href seen before
+        # resolves to the same URL, so it needs no second look
+        if href in checked_hrefs:
+            continue
+        checked_hrefs.add(href)
 
         # Skip fragment-only links, javascript:, mailto:, tel:
         if href.startswith(("#", "javascript:", "mailto:", "tel:")):
@@ -199,12 +179,7 @@ def find_internal_links(html: str, base_url: str) -> list[str]:
             normalized += f"?{parsed.query}"
 
         # Skip common non-page resources
-        path_lower = parsed.path.lower()
-        skip_extensions = (
-            ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp", ".ico",
-            ".css", ".js", ".pdf", ".zip", ".xml", ".json",
-        )
-        if any(path_lower.endswith(ext) for ext in skip_extensions):
+        if parsed.path.lower().endswith(SKIP_EXTENSIONS):
             continue
 
         if normalized not in seen:
@@ -218,7 +193,7 @@ async def check_page(
     url: str,
     client: httpx.AsyncClient,
     follow_redirects: bool = True,
-) -> PageResult:
+) -> tuple[PageResult, Optional[ParsedPage]]:
     """Perform a full SEO check on a single page.
 
     Args:
@@ -227,12 +202,14 @@ async def check_page(
         follow_redirects: Whether to follow redirects.
 
     Returns:
-        PageResult with all check results.
+        Tuple of (PageResult with all check results, the parsed page if it
+        returned 200, else None), so callers can extract links without
+        fetching or parsing the page again.
     """
     response, redirect_chain = await fetch_page(url, client, follow_redirects)
 
     if response is None:
-        return PageResult(
+        page_result = PageResult(
             url=url,
             status_code=0,
             checks=[
@@ -246,13 +223,15 @@ async def check_page(
             ],
             redirect_chain=redirect_chain,
         )
+        return page_result, None
 
     html = response.text
     headers = dict(response.headers)
     status_code = response.status_code
 
-    # Parse meta tags
-    meta = parse_meta_tags(html)
+    # Parse once; the meta tag, Next.js and link checks all use the result
+    page = parse_page(html)
+    meta = page.meta
 
     # Run all checks
     checks: list[SEOCheck] = []
@@ -274,9 +253,9 @@ async def check_page(
     checks.append(check_og_tags(meta.get("og_tags", {})))
 
     # Next.js specific checks
-    checks.extend(check_nextjs_issues(html, headers))
+    checks.extend(check_nextjs_issues(html, headers, page))
 
-    return PageResult(
+    page_result = PageResult(
         url=url,
         status_code=status_code,
         title=meta.get("title"),
@@ -286,3 +265,4 @@ async def check_page(
         checks=checks,
         redirect_chain=redirect_chain if redirect_chain.hops else None,
     )
+    return page_result, page if status_code == 200 else None
@@ -0,0 +1,143 @@
+"""HTML parsing for the Next.js SEO debugger.
+
+Each page is parsed once into a ParsedPage holding everything the checks
+read. selectolax's lexbor parser is used when installed, being many times
+faster than BeautifulSoup on large pages; otherwise BeautifulSoup with lxml
+is used. Results match, except that lexbor (like browsers) keeps <template>
+contents out of the document, so links inside templates aren't followed.
+"""
+
+from nextjs_seo_debugger.models import ParsedPage
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Meta tags read by name, and the keys they are stored under
+_NAMED_META = ("description", "robots", "googlebot")
+
+# Elements whose text BeautifulSoup's get_text() leaves out (after the SSR
+# check has removed scripts)
+_NON_TEXT_PARENTS = ("script", "style")
+
+
+def parse_page(html: str) -> ParsedPage:
+    """Parse HTML once, extracting meta tags, link targets and #__next text.
+
+    Args:
+        html: The HTML content to parse.
+
+    Returns:
+        ParsedPage with the extracted content.
+    """
+    if LexborHTMLParser is not None:
+        return _parse_with_lexbor(html)
+    return _parse_with_bs4(html)
+
+
+def _parse_with_bs4(html: str) -> ParsedPage:
+    """Extract page content with BeautifulSoup and lxml."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "lxml")
+    meta: dict = {}
+
+    # Title
+    title_tag = soup.find("title")
+    meta["title"] = title_tag.get_text(strip=True) if title_tag else None
+
+    # Meta description
+    desc_tag = soup.find("meta", attrs={"name": "description"})
+    meta["description"] = desc_tag.get("content", "") if desc_tag else None
+
+    # Canonical link
+    canonical_tag = soup.find("link", attrs={"rel": "canonical"})
+    meta["canonical"] = canonical_tag.get("href", "") if canonical_tag else None
+
+    # Robots meta
+    robots_tag = soup.find("meta", attrs={"name": "robots"})
+    meta["robots"] = robots_tag.get("content", "") if robots_tag else None
+
+    # Googlebot-specific meta
+    googlebot_tag = soup.find("meta", attrs={"name": "googlebot"})
+    meta["googlebot"] = googlebot_tag.get("content", "") if googlebot_tag else None
+
+    # Open Graph tags
+    og_tags: dict[str, str] = {}
+    for tag in soup.find_all("meta", attrs={"property": True}):
+        prop = tag.get("property", "")
+        if prop.startswith("og:"):
+            og_tags[prop] = tag.get("content", "")
+    meta["og_tags"] = og_tags
+
+    hrefs = [a_tag["href"] for a_tag in soup.find_all("a", href=True)]
+
+    # Last, since it removes the scripts from the tree
+    next_text = None
+    next_div = soup.find(id="__next")
+    if next_div:
+        for script in next_div.find_all("script"):
+            script.decompose()
+        next_text = next_div.get_text(strip=True)
+
+    return ParsedPage(meta=meta, hrefs=hrefs, next_text=next_text)
+
+
+def _parse_with_lexbor(html: str) -> ParsedPage:
+    """Extract page content with selectolax, matching _parse_with_bs4().
+
+    Attributes are compared in Python rather than with CSS attribute
+    selectors, whose case sensitivity depends on the attribute and on quirks
+    mode. Valueless attributes read as None here but as "" in BeautifulSoup.
+    """
+    tree = LexborHTMLParser(html)
+    meta: dict = {}
+
+    title_tag = tree.css_first("title")
+    meta["title"] = title_tag.text(strip=True) if title_tag is not None else None
+
+    named: dict[str, str] = {}
+    og_tags: dict[str, str] = {}
+    for tag in tree.css("meta"):
+        attrs = tag.attributes
+        name = attrs.get("name")
+        if name in _NAMED_META and name not in named:
+            named[name] = attrs.get("content") or ""
+        if "property" in attrs:
+            prop = attrs["property"] or ""
+            if prop.startswith("og:"):
+                og_tags[prop] = attrs.get("content") or ""
+    meta["description"] = named.get("description")
+
+    # rel is a list of tokens, as BeautifulSoup treats it
+    meta["canonical"] = None
+    for tag in tree.css("link"):
+        attrs = tag.attributes
+        if "canonical" in (attrs.get("rel") or "").split():
+            meta["canonical"] = attrs.get("href") or ""
+            break
+
+    meta["robots"] = named.get("robots")
+    meta["googlebot"] = named.get("googlebot")
+    meta["og_tags"] = og_tags
+
+    hrefs = []
+    for a_tag in tree.css("a"):
+        attrs = a_tag.attributes
+        if "href" in attrs:
+            hrefs.append(attrs["href"] or "")
+
+    next_text = None
+    for tag in tree.css("[id]"):
+        if tag.attributes.get("id") == "__next":
+            parts = []
+            for node in tag.traverse(include_text=True):
+                if node.tag == "-text" and node.parent.tag not in _NON_TEXT_PARENTS:
+                    text = node.text(deep=False).strip()
+                    if text:
+                        parts.append(text)
+            next_text = "".join(parts)
+            break
+
+    return ParsedPage(meta=meta, hrefs=hrefs, next_text=next_text)
@@ -69,6 +69,27 @@ class PageResult(BaseModel):
     redirect_chain: Optional[RedirectChain] = None
 
 
+class ParsedPage(BaseModel):
+    """SEO-relevant content extracted from a single parse of a page's HTML."""
+
+    # Title, description, canonical, robots, googlebot and og_tags
+    meta: dict = Field(default_factory=dict)
+    # href of every <a> that has one, in document order
+    hrefs: list[str] = Field(default_factory=list)
+    # Text of the #__next div without its scripts; None if there is no such div
+    next_text: Optional[str] = None
+
+
+class SitemapEntries(BaseModel):
+    """Counts for the <url> entries of a sitemap, gathered while parsing it."""
+
+    page_count: int = 0
+    urls_with_loc: int = 0
+    urls_with_lastmod: int = 0
+    # Stripped <loc> text of the first few entries, in document order
+    sample_urls: list[str] = Field(default_factory=list)
+
+
 class SitemapResult(BaseModel):
     """Result of sitemap.xml analysis."""
 
@@ -1,15 +1,28 @@
 """Sitemap.xml checker for the Next.js SEO debugger."""
 
+import asyncio
+import bisect
+from io import BytesIO, StringIO
+from typing import IO
 from urllib.parse import urljoin
 from xml.etree import ElementTree
 
 import httpx
 
-from nextjs_seo_debugger.models import SitemapResult
+from nextjs_seo_debugger.models import SitemapEntries, SitemapResult
 
 GOOGLEBOT_UA = "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)"
 REQUEST_TIMEOUT = 10.0
 
+# Entries whose URLs are kept for spot-checking
+MAX_SAMPLE_URLS = 5
+
+_SM = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+_SM_SITEMAP = _SM + "sitemap"
+_SM_URL = _SM + "url"
+_SM_LOC = _SM + "loc"
+_SM_LASTMOD = _SM + "lastmod"
+
 
 async def check_sitemap(base_url: str, client: httpx.AsyncClient) -> SitemapResult:
     """Fetch and analyze sitemap.xml.
@@ -72,7 +85,7 @@ async def check_sitemap(base_url: str, client: httpx.AsyncClient) -> SitemapResu
 
     # Parse XML
     try:
-        root = ElementTree.fromstring(response.text)
+        index_count, entries = _parse_sitemap_xml(response)
     except ElementTree.ParseError as e:
         return SitemapResult(
             found=True,
@@ -82,29 +95,19 @@ async def check_sitemap(base_url: str, client: httpx.AsyncClient) -> SitemapResu
         )
 
     # Handle sitemap index
-    ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-    sitemap_tags = root.findall(".//sm:sitemap", ns)
-    if sitemap_tags:
-        # This is a sitemap index
-        sub_count = len(sitemap_tags)
+    if index_count:
         issues.append(
-            f"Sitemap index found with {sub_count} sub-sitemap(s). "
+            f"Sitemap index found with {index_count} sub-sitemap(s). "
             "Only the index was analyzed, not individual sub-sitemaps."
         )
         return SitemapResult(
             found=True,
             url=sitemap_url,
-            page_count=sub_count,
+            page_count=index_count,
             issues=issues,
         )
 
-    # Parse URL entries
-    url_tags = root.findall(".//sm:url", ns)
-    # Also try without namespace (some sitemaps don't use it)
-    if not url_tags:
-        url_tags = root.findall(".//url")
-
-    page_count = len(url_tags)
+    page_count = entries.page_count
 
     if page_count == 0:
         issues.append(
@@ -119,25 +122,9 @@ async def check_sitemap(base_url: str, client: httpx.AsyncClient) -> SitemapResu
         )
 
     # Check for common issues
-    urls_with_lastmod = 0
-    urls_with_loc = 0
-    sample_urls: list[str] = []
-
-    for url_tag in url_tags:
-        loc = url_tag.find("sm:loc", ns)
-        if loc is None:
-            loc = url_tag.find("loc")
-
-        if loc is not None and loc.text:
-            urls_with_loc += 1
-            if len(sample_urls) < 5:
-                sample_urls.append(loc.text.strip())
-
-        lastmod = url_tag.find("sm:lastmod", ns)
-        if lastmod is None:
-            lastmod = url_tag.find("lastmod")
-        if lastmod is not None and lastmod.text:
-            urls_with_lastmod += 1
+    urls_with_lastmod = entries.urls_with_lastmod
+    urls_with_loc = entries.urls_with_loc
+    sample_urls = entries.sample_urls
 
     if urls_with_loc < page_count:
         issues.append(
@@ -155,21 +142,13 @@ async def check_sitemap(base_url: str, client: httpx.AsyncClient) -> SitemapResu
             "Consider adding lastmod to all entries."
         )
 
-    # Spot-check a few URLs for accessibility (up to 3)
+    # Spot-check a few URLs for accessibility (up to 3), all at once;
+    # gather() keeps the issues in sitemap order
     spot_check_count = min(3, len(sample_urls))
-    for url in sample_urls[:spot_check_count]:
-        try:
-            check_resp = await client.head(
-                url,
-                follow_redirects=True,
-                timeout=5.0,
-            )
-            if check_resp.status_code != 200:
-                issues.append(
-                    f"Sitemap URL returns HTTP {check_resp.status_code}: {url}"
-                )
-        except Exception:
-            issues.append(f"Sitemap URL is unreachable: {url}")
+    spot_check_issues = await asyncio.gather(
+        *(_spot_check_url(url, client) for url in sample_urls[:spot_check_count])
+    )
+    issues.extend(issue for issue in spot_check_issues if issue is not None)
 
     return SitemapResult(
         found=True,
@@ -177,3 +156,99 @@ async def check_sitemap(base_url: str, client: httpx.AsyncClient) -> SitemapResu
         page_count=page_count,
         issues=issues,
     )
+
+
+def _parse_sitemap_xml(response: httpx.Response) -> tuple[int, SitemapEntries]:
+    """Parse the sitemap body, from its raw bytes where that's equivalent.
+
+    Decoding a large sitemap to str only for ElementTree to re-encode it
+    doubles its memory, so UTF-8 bodies are handed to the parser as bytes.
+    A body that doesn't parse that way (such as invalid UTF-8, which
+    response.text replaces) is parsed from response.text as before.
+
+    Returns:
+        Tuple of (number of sub-sitemaps if this is a sitemap index, else 0,
+        counts for its <url> entries).
+    """
+    if (response.charset_encoding or "utf-8").lower() in ("utf-8", "utf8"):
+        try:
+            return _summarize_sitemap(BytesIO(response.content))
+        except ElementTree.ParseError:
+            pass
+    return _summarize_sitemap(StringIO(response.text))
+
+
+def _summarize_sitemap(source: IO) -> tuple[int, SitemapEntries]:
+    """Count a sitemap's entries in one streaming pass over its XML.
+
+    Each entry is detached from its parent once counted, so memory stays
+    flat on sitemaps of up to 50,000 URLs. The counts are those of findall(".//sm:sitemap") and
+    findall(".//sm:url") on the parsed root, falling back to <url> elements
+    without the namespace when there are no namespaced ones.
+    """
+    index_count = 0
+    entries = {_SM_URL: SitemapEntries(), "url": SitemapEntries()}
+    # Samples are kept as (start position, URL), so an entry nested in
+    # another still sorts in document order
+    samples: dict[str, list[tuple[int, str]]] = {_SM_URL: [], "url": []}
+    starts: list[int] = []
+    # Elements still open, innermost last; the first is the root
+    open_elems: list[ElementTree.Element] = []
+    position = 0
+
+    for event, elem in ElementTree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            open_elems.append(elem)
+            position += 1
+            if elem.tag in entries:
+                starts.append(position)
+            continue
+
+        open_elems.pop()
+        if not open_elems:
+            continue  # The root element itself isn't an entry
+
+        if elem.tag == _SM_SITEMAP:
+            index_count += 1
+            open_elems[-1].remove(elem)
+        elif elem.tag in entries:
+            counts = entries[elem.tag]
+            start = starts.pop()
+            counts.page_count += 1
+
+            loc = elem.find(_SM_LOC)
+            if loc is None:
+                loc = elem.find("loc")
+            if loc is not None and loc.text:
+                counts.urls_with_loc += 1
+                tag_samples = samples[elem.tag]
+                if len(tag_samples) < MAX_SAMPLE_URLS or start < tag_samples[-1][0]:
+                    bisect.insort(tag_samples, (start, loc.text.strip()))
+                    del tag_samples[MAX_SAMPLE_URLS:]
+
+            lastmod = elem.find(_SM_LASTMOD)
+            if lastmod is None:
+                lastmod = elem.find("lastmod")
+            if lastmod is not None and lastmod.text:
+                counts.urls_with_lastmod += 1
+
+            open_elems[-1].remove(elem)
+
+    tag = _SM_URL if entries[_SM_URL].page_count else "url"
+    entries[tag].sample_urls = [url for _, url in samples[tag]]
+    return index_count, entries[tag]
+
+
+async def _spot_check_url(url: str, client: httpx.AsyncClient) -> str | None:
+    """Check that a sitemap URL is reachable, returning the issue if not."""
+    try:
+        check_resp = await client.head(
+            url,
+            follow_redirects=True,
+            timeout=5.0,
+        )
+        if check_resp.status_code != 200:
+            return f"Sitemap URL returns HTTP {check_resp.status_code}: {url}"
+    except Exception:
+        return f"Sitemap URL is unreachable: {url}"
+    return None